@@ -3,12 +3,22 @@ Configuration file for the Venture Funding Monitor
 Contains RSS feed URLs, regex patterns, and all configuration settings.
 """
 
+import functools
 import os
 import re
+from typing import Dict, Optional
+
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Regex engine for the hot detection patterns.
+# Google's RE2 (pip install google-re2) matches in linear time without
+# backtracking; fall back to the standard library when it isn't installed.
+# RE2's compile() takes no flags argument, so patterns below use inline
+# flags such as (?i), which both engines understand.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
 
 # ====================
 # RSS FEED SOURCES
@@ -41,22 +51,74 @@ RSS_FEEDS = {
 
 SMTP_SERVER = 'smtp.gmail.com'
 SMTP_PORT = 587  # TLS port for secure connection
+SMTP_TIMEOUT = 30  # Seconds to wait on the SMTP socket
+SMTP_IDLE_TIMEOUT = 100  # Reconnect if the connection sat idle longer (servers drop idle sessions)
+SMTP_MAX_MESSAGES_PER_CONNECTION = 10000  # Recycle the connection after this many messages
+SMTP_MAX_RECIPIENTS = 100  # Recipients per SMTP transaction (larger lists are split into batches)
+SMTP_BATCH_DELAY = 0.5  # Seconds between batches (Gmail throttles bursts above ~2 messages/second)
 
 # Email credentials from environment variables (stored in .env file)
-GMAIL_ADDRESS = os.getenv('GMAIL_ADDRESS')
-GMAIL_APP_PASSWORD = os.getenv('GMAIL_APP_PASSWORD')
-RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL', GMAIL_ADDRESS)  # Default to sender if not specified
+# These are read lazily: the .env file is only parsed the first time one of
+# GMAIL_ADDRESS, GMAIL_APP_PASSWORD, RECIPIENT_EMAIL(S) or DIGEST_TYPE is
+# accessed (via the module-level __getattr__ below), so code that only needs
+# the regex patterns never touches the disk for secrets.
+#
+# RECIPIENT_EMAIL may hold several comma-separated addresses;
+# RECIPIENT_EMAILS is the parsed list.
+
+
+@functools.lru_cache(maxsize=1)
+def _env() -> Dict[str, Optional[str]]:
+    """Load the .env file once and return the environment-based settings."""
+    load_dotenv()
+
+    gmail_address = os.getenv('GMAIL_ADDRESS')
+    recipient_email = os.getenv('RECIPIENT_EMAIL', gmail_address)  # Default to sender if not specified
+    return {
+        'GMAIL_ADDRESS': gmail_address,
+        'GMAIL_APP_PASSWORD': os.getenv('GMAIL_APP_PASSWORD'),
+        'RECIPIENT_EMAIL': recipient_email,
+        'RECIPIENT_EMAILS': [addr.strip() for addr in (recipient_email or '').split(',') if addr.strip()],
+        'DIGEST_TYPE': os.getenv('DIGEST_TYPE', 'daily'),  # 'daily' or 'weekly'
+        # Optional: comma-separated memcached servers for the template cache
+        'MEMCACHED_SERVERS': [addr.strip() for addr in os.getenv('MEMCACHED_SERVERS', '').split(',') if addr.strip()],
+    }
+
+
+_ENV_SETTINGS = frozenset([
+    'GMAIL_ADDRESS', 'GMAIL_APP_PASSWORD', 'RECIPIENT_EMAIL', 'RECIPIENT_EMAILS', 'DIGEST_TYPE',
+    'MEMCACHED_SERVERS'
+])
+
+
+def __getattr__(name: str):
+    """Resolve environment-based settings and lazy patterns on first access (PEP 562)."""
+    if name in _ENV_SETTINGS:
+        return _env()[name]
+    if name in _LAZY_PATTERNS:
+        pattern = _rx(_LAZY_PATTERNS[name])
+        globals()[name] = pattern  # Later lookups skip __getattr__
+        return pattern
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Email subject templates
 EMAIL_SUBJECT_DAILY = 'Daily Funding Digest - {count} New Opportunities - {date}'
 EMAIL_SUBJECT_WEEKLY = 'Weekly Funding Digest - {count} New Opportunities - Week of {date}'
 
+# Compiled Jinja2 templates are cached here between runs (skips reparsing);
+# set MEMCACHED_SERVERS in .env (and install pylibmc) to use memcached instead
+TEMPLATE_CACHE_DIR = '.jinja_cache'
+
 # ====================
 # DATABASE CONFIGURATION
 # ====================
 
 DATABASE_PATH = os.path.join('data', 'funding_monitor.db')
 DATABASE_CLEANUP_DAYS = 90  # Delete articles older than 90 days
+DATABASE_CLEANUP_BATCH_SIZE = 1000  # Rows deleted per transaction during cleanup
+DATABASE_POOL_SIZE = 5      # Pre-opened connections for read queries
+PROCESSED_URL_CACHE_SIZE = 100000  # Stored URLs remembered in-process (skips the DB lookup)
 
 # ====================
 # FILTERING CONFIGURATION
@@ -65,6 +127,15 @@ DATABASE_CLEANUP_DAYS = 90  # Delete articles older than 90 days
 
 LOOKBACK_DAYS = 60  # Only process articles from the last 60 days
 RELEVANCE_THRESHOLD = 50  # Minimum score (0-100) to include an article in the digest
+DIGEST_MAX_ANNOUNCEMENTS = 500  # Most recent pending announcements loaded per digest
+SCORE_CACHE_SIZE = 4096   # Detector results memoized per process (syndicated stories repeat)
+REQUIRE_FUNDING_TERMS = True  # Skip articles that mention neither a funding keyword nor a stage
+
+# Large batches are analyzed in a process pool (regex scanning holds the GIL).
+# Below the threshold, pool startup and pickling cost more than they save
+# (~80 µs of detection per article).
+DETECTION_PARALLEL_MIN_ARTICLES = 5000
+DETECTION_CHUNK_SIZE = 64  # Articles sent to a worker per task
 
 # ====================
 # REGEX PATTERNS
@@ -73,75 +144,124 @@ RELEVANCE_THRESHOLD = 50  # Minimum score (0-100) to include an article in the d
 
 # 1. FUNDING KEYWORDS
 # Detect general funding announcements
-FUNDING_KEYWORDS_PATTERN = re.compile(
-    r'\b(raises?|raised|secures?|secured|closes?|closed|funding|investment|backs?|backed)\b',
-    re.IGNORECASE
+_FUNDING_KEYWORDS_SOURCE = (
+    r'raises?|raised|secures?|secured|closes?|closed|funding|investment|backs?|backed'
 )
 
+FUNDING_KEYWORDS_PATTERN = _re.compile(rf'(?i)\b(?:{_FUNDING_KEYWORDS_SOURCE})\b')
+
 # 2. FUNDING STAGES
 # Detect specific funding rounds
-FUNDING_STAGES = {
-    'Seed': re.compile(r'\b(seed\s+round|seed\s+funding|pre-seed)\b', re.IGNORECASE),
-    'Series A': re.compile(r'\b(series\s+a|series-a)\b', re.IGNORECASE),
-    'Series B': re.compile(r'\b(series\s+b|series-b)\b', re.IGNORECASE),
-    'Series C': re.compile(r'\b(series\s+c|series-c)\b', re.IGNORECASE),
+# All stages share one pattern so the text is scanned once; the named group
+# that matched tells us which stage it was. Groups are listed in priority
+# order (Seed first), which the detector relies on.
+_FUNDING_STAGES_SOURCE = (
+    r'(?P<Seed>seed\s+round|seed\s+funding|pre-seed)'
+    r'|(?P<SeriesA>series\s+a|series-a)'
+    r'|(?P<SeriesB>series\s+b|series-b)'
+    r'|(?P<SeriesC>series\s+c|series-c)'
+)
+
+FUNDING_STAGES_COMBINED = _re.compile(rf'(?i)\b(?:{_FUNDING_STAGES_SOURCE})\b')
+
+# Cheap pre-check used before the full article scan: any funding keyword or
+# stage. Without one, an article can only score location + industry points.
+FUNDING_TERMS_PATTERN = _re.compile(
+    rf'(?i)\b(?:{_FUNDING_KEYWORDS_SOURCE}|{_FUNDING_STAGES_SOURCE})\b'
+)
+
+# Display name for each named group in FUNDING_STAGES_COMBINED
+FUNDING_STAGE_NAMES = {
+    'Seed': 'Seed',
+    'SeriesA': 'Series A',
+    'SeriesB': 'Series B',
+    'SeriesC': 'Series C',
 }
 
 # 3. FUNDING AMOUNT EXTRACTION
-# Extract amounts like "$10M", "£5 million", "€20 million"
-AMOUNT_PATTERNS = [
-    # Pattern 1: $10M, £5m, €20B format
-    re.compile(r'[\$£€]\s*(\d+(?:\.\d+)?)\s*(m(?:illion)?|b(?:illion)?|k(?:thousand)?)\b', re.IGNORECASE),
-    # Pattern 2: "10 million dollars" format
-    re.compile(r'(\d+(?:\.\d+)?)\s*(million|billion)\s*(dollars?|pounds?|euros?)', re.IGNORECASE),
-]
+# Extract amounts like "$10M", "£5 million", "€500k", "20 million euros"
+# Both formats are alternatives of one pattern (one scan of the text);
+# match.lastgroup (the unit group, which closes last) shows which matched.
+AMOUNT_PATTERN = _re.compile(
+    # Format 1: $10M, £5m, €20B, $500k, $500 thousand
+    r'(?i)[\$£€]\s*(?P<num1>\d+(?:\.\d+)?)\s*(?P<unit1>m(?:illion)?|b(?:illion)?|k|thousand)\b'
+    # Format 2: "10 million dollars", "500 thousand euros"
+    r'|(?P<num2>\d+(?:\.\d+)?)\s*(?P<unit2>million|billion|thousand)\s*(?:dollars?|pounds?|euros?)'
+)
+
+# Normalized suffix for each unit, keyed by its lowercase first letter
+AMOUNT_UNIT_SUFFIXES = {'m': 'M', 'b': 'B', 'k': 'K', 't': 'K'}
 
 # 4. COMPANY NAME EXTRACTION
 # Extract company names from article titles
-COMPANY_NAME_PATTERNS = [
-    # Pattern 1: "CompanyName raises $X" (high confidence)
-    re.compile(r'^([A-Z][A-Za-z0-9\s&.\'-]{2,40}?)\s+(?:raises?|secures?|closes?|lands?)'),
-    # Pattern 2: "CompanyName, a [description], raises $X" (high confidence)
-    re.compile(r'^([A-Z][A-Za-z0-9\s&.\'-]{2,40}?),\s+an?\s+'),
-    # Pattern 3: "CompanyName has raised" (medium confidence)
-    re.compile(r'([A-Z][A-Za-z0-9\s&.\'-]{2,40}?)\s+(?:has\s+)?(?:raised|secured)'),
-]
+# The three title shapes are merged into one pattern, tried in priority order
+# (the anchored alternatives can only match at the start of the title, so
+# they are always attempted before the unanchored fallback). Verbs end with
+# \b so words like "landscape" or "closest" don't count as "lands"/"closes".
+#
+# Only needed for articles that pass the relevance threshold, so it is
+# compiled on first use rather than at import (see _LAZY_PATTERNS).
+_COMPANY_NAME_SOURCE = (
+    # 1: "CompanyName raises $X" (high confidence)
+    r'^(?P<raises>[A-Z][A-Za-z0-9\s&.\'-]{2,40}?)\s+(?:raises?|secures?|closes?|lands?)\b'
+    # 2: "CompanyName, a [description], raises $X" (high confidence)
+    r'|^(?P<described>[A-Z][A-Za-z0-9\s&.\'-]{2,40}?),\s+an?\s+'
+    # 3: "CompanyName has raised" (medium confidence)
+    r'|(?P<raised>[A-Z][A-Za-z0-9\s&.\'-]{2,40}?)\s+(?:has\s+)?(?:raised|secured)\b'
+)
 
 # 5. LOCATION DETECTION
 # Geographic focus: UK (priority), Europe, and Middle East
+# One combined pattern with a named group per region, in priority order
+# (UK > EU > ME).
 
-UK_KEYWORDS_PATTERN = re.compile(
-    r'\b(UK|U\.K\.|United Kingdom|London|Manchester|Edinburgh|Bristol|Cambridge|Oxford|Birmingham|Leeds|Glasgow)\b',
-    re.IGNORECASE
+_LOCATION_SOURCE = (
+    r'(?P<UK>UK|U\.K\.|United Kingdom|London|Manchester|Edinburgh|Bristol|Cambridge|Oxford|Birmingham|Leeds|Glasgow)'
+    r'|(?P<EU>Europe|European|Berlin|Paris|Amsterdam|Stockholm|Dublin|Copenhagen|Zurich|Barcelona|Madrid|Milan|Lisbon|Brussels|Munich|Hamburg|Vienna)'
+    r'|(?P<ME>Middle East|Dubai|Abu Dhabi|UAE|U\.A\.E\.|Tel Aviv|Israel|Israeli|Riyadh|Saudi Arabia|Bahrain|Qatar|Doha|Kuwait)'
 )
 
-EU_KEYWORDS_PATTERN = re.compile(
-    r'\b(Europe|European|Berlin|Paris|Amsterdam|Stockholm|Dublin|Copenhagen|Zurich|Barcelona|Madrid|Milan|Lisbon|Brussels|Munich|Hamburg|Vienna)\b',
-    re.IGNORECASE
-)
-
-ME_KEYWORDS_PATTERN = re.compile(
-    r'\b(Middle East|Dubai|Abu Dhabi|UAE|U\.A\.E\.|Tel Aviv|Israel|Israeli|Riyadh|Saudi Arabia|Bahrain|Qatar|Doha|Kuwait)\b',
-    re.IGNORECASE
-)
+LOCATION_COMBINED = _re.compile(rf'(?i)\b(?:{_LOCATION_SOURCE})\b')
 
 # 6. INDUSTRY DETECTION
 # Priority industries: Fintech and SaaS
+# One combined pattern with a named group per industry, in priority order
+# (Fintech > SaaS > other Tech).
 
-FINTECH_KEYWORDS_PATTERN = re.compile(
-    r'\b(fintech|financial\s+technology|payments?|banking|digital\s+bank|neobank|crypto(?:currency)?|blockchain|digital\s+wallet|wealthtech)\b',
-    re.IGNORECASE
+_INDUSTRY_SOURCE = (
+    r'(?P<Fintech>fintech|financial\s+technology|payments?|banking|digital\s+bank|neobank|crypto(?:currency)?|blockchain|digital\s+wallet|wealthtech)'
+    r'|(?P<SaaS>SaaS|software-as-a-service|B2B\s+software|enterprise\s+software|cloud\s+software|cloud\s+platform)'
+    r'|(?P<Tech>tech-enabled|proptech|healthtech|edtech|insurtech|AI|artificial\s+intelligence|machine\s+learning|data\s+analytics|cybersecurity)'
 )
 
-SAAS_KEYWORDS_PATTERN = re.compile(
-    r'\b(SaaS|software-as-a-service|B2B\s+software|enterprise\s+software|cloud\s+software|cloud\s+platform)\b',
-    re.IGNORECASE
+INDUSTRY_COMBINED = _re.compile(rf'(?i)\b(?:{_INDUSTRY_SOURCE})\b')
+
+# 7. SINGLE-PASS ARTICLE SCAN
+# Keywords, stages, locations and industries merged into one pattern, so the
+# detector walks the article text once and reads the category off the named
+# group of each match. "seed funding" gets its own group because it is both
+# a stage and a funding keyword, and a match can only belong to one group.
+ARTICLE_SCAN_PATTERN = _re.compile(
+    r'(?i)\b(?:'
+    r'(?P<SeedFunding>seed\s+funding)'
+    rf'|(?P<Funding>{_FUNDING_KEYWORDS_SOURCE})'
+    rf'|{_FUNDING_STAGES_SOURCE}'
+    rf'|{_LOCATION_SOURCE}'
+    rf'|{_INDUSTRY_SOURCE}'
+    r')\b'
 )
 
-TECH_KEYWORDS_PATTERN = re.compile(
-    r'\b(tech-enabled|proptech|healthtech|edtech|insurtech|AI|artificial\s+intelligence|machine\s+learning|data\s+analytics|cybersecurity)\b',
-    re.IGNORECASE
-)
+# Patterns compiled on first access (name -> source)
+_LAZY_PATTERNS = {
+    'COMPANY_NAME_PATTERN': _COMPANY_NAME_SOURCE,
+}
+
+
+@functools.cache
+def _rx(pattern: str):
+    """Compile a pattern with the configured engine, caching the result."""
+    return _re.compile(pattern)
+
 
 # ====================
 # SCORING WEIGHTS
@@ -164,7 +284,15 @@ SCORE_TECH = 10              # Other tech sectors
 REQUEST_TIMEOUT = 10  # Seconds to wait for RSS feed response
 REQUEST_RETRIES = 3   # Number of retry attempts for failed requests
 REQUEST_BACKOFF = 1   # Exponential backoff factor (1s, 2s, 4s)
-REQUEST_DELAY = 2     # Seconds to wait between feed requests (be polite)
+REQUEST_MAX_PER_HOST = 2  # Concurrent requests allowed to one host (be polite)
 
 # User agent to identify our bot
 USER_AGENT = 'VentureFundingMonitor/1.0 (Educational project; +https://github.com/yourusername/startup_finder_agent)'
+
+# ====================
+# LOGGING CONFIGURATION
+# ====================
+
+LOG_FILE = 'funding_monitor.log'
+LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate the log file at 5 MB
+LOG_BACKUP_COUNT = 3             # Rotated log files to keep
@@ -4,16 +4,141 @@ Handles all SQLite database operations including schema creation,
 article storage, and funding announcement tracking.
 """
 
+import hashlib
 import sqlite3
 import logging
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple
 from src import config
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Column definitions for the articles table (shared by schema creation and migration)
+# Uniqueness is enforced on the 64-bit url_hash rather than the full URL text,
+# which keeps the dedupe index small and makes lookups an integer compare.
+# content_hash catches the same story republished under a different URL
+# (NULL for rows stored before it was added).
+_ARTICLES_COLUMNS_SQL = '''
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    url_hash INTEGER NOT NULL,
+    content_hash INTEGER,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    published_date TEXT NOT NULL,
+    processed_date TEXT NOT NULL,
+    is_funding_related INTEGER NOT NULL,
+    relevance_score INTEGER DEFAULT 0
+'''
+
+# Shared INSERT statements (used by single-row and bulk store methods)
+_INSERT_ARTICLE_SQL = '''
+    INSERT OR IGNORE INTO articles
+    (url, title, source, published_date, is_funding_related, relevance_score,
+     content_hash, url_hash, processed_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_ANNOUNCEMENT_SQL = '''
+    INSERT INTO funding_announcements
+    (article_id, company_name, funding_stage, funding_amount,
+     location, industry, description, extracted_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Max values per "WHERE ... IN (...)" lookup query (stays under the 999 bound
+# parameters allowed by SQLite builds older than 3.32)
+_LOOKUP_CHUNK_SIZE = 900
+
+
+def _url_hash(url: str) -> int:
+    """
+    Hash a URL to a signed 64-bit integer (fits a SQLite INTEGER column).
+
+    Args:
+        url: Article URL
+
+    Returns:
+        blake2b-based 64-bit hash of the URL
+    """
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+def content_hash(title: str, description: str) -> int:
+    """
+    Hash an article's text to a signed 64-bit integer.
+
+    Case and whitespace are normalized first, so the same story syndicated
+    under different URLs (tracking parameters, changed slugs) hashes equal.
+
+    Args:
+        title: Article title
+        description: Article description (HTML already stripped)
+
+    Returns:
+        blake2b-based 64-bit hash of the normalized title + description
+    """
+    text = ' '.join(f"{title} {description}".lower().split())
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+class SQLiteConnectionPool:
+    """
+    Small pool of pre-opened SQLite connections.
+
+    Opening a connection (and applying its pragmas) costs far more than
+    checking one out of a queue, so read queries borrow an already
+    configured connection instead of opening their own.
+
+    Connections are created with check_same_thread=False so they can be
+    handed to worker threads; the queue guarantees each connection is
+    only used by one thread at a time.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], size: int):
+        """
+        Pre-open the pool's connections.
+
+        Args:
+            factory: Callable returning a new, configured connection
+            size: Number of connections to keep open
+        """
+        self._pool = queue.Queue(maxsize=size)
+        self._connections = []
+
+        for _ in range(size):
+            conn = factory()
+            self._connections.append(conn)
+            self._pool.put(conn)
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection from the pool (blocks until one is free).
+
+        Usage:
+            with pool.acquire() as conn:
+                conn.execute(...)
+        """
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self):
+        """Close all pooled connections."""
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
+
 
 class DatabaseManager:
     """
@@ -26,6 +151,11 @@ class DatabaseManager:
     - Perfect for single-user applications
     - ACID compliant (won't lose data even if process crashes)
     - You already know SQL from your BI work!
+
+    Connections:
+    - self.conn: dedicated writer connection (SQLite allows one writer)
+    - self.pool: pre-opened connections for read queries (and for the
+      background cleanup, see start_cleanup)
     """
 
     def __init__(self, db_path: str = None):
@@ -42,27 +172,91 @@ class DatabaseManager:
 
         # Initialize database
         self.conn = None
+        self.pool = None
+
+        # URLs known to be stored. Only positive results are cached: a URL
+        # missing from the database can be inserted later, a stored one stays
+        # until cleanup_old_entries() (which clears this set).
+        self._processed_urls: Set[str] = set()
+
         self._connect()
         self._create_schema()
 
+        # Readers get their own connections so they never queue behind the writer
+        self.pool = SQLiteConnectionPool(
+            lambda: self._open_connection(check_same_thread=False),
+            config.DATABASE_POOL_SIZE
+        )
+
     def _connect(self):
         """
-        Connect to SQLite database with optimizations.
-        Uses WAL (Write-Ahead Logging) mode for better performance.
+        Open the dedicated writer connection.
         """
         try:
-            self.conn = sqlite3.connect(self.db_path, timeout=30)
-            self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-
-            # Enable WAL mode for better concurrency
-            self.conn.execute("PRAGMA journal_mode=WAL")
-
+            self.conn = self._open_connection()
+            self._bootstrap_db(self.conn)
             logger.info(f"Connected to database: {self.db_path}")
 
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
 
+    def _open_connection(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        Open a new SQLite connection with per-connection settings applied.
+
+        Args:
+            check_same_thread: Passed to sqlite3.connect (False for pooled connections)
+
+        Returns:
+            Configured sqlite3.Connection
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        self._configure_conn(conn)
+        return conn
+
+    @staticmethod
+    def _bootstrap_db(conn: sqlite3.Connection):
+        """
+        Apply database-wide settings that persist in the file itself.
+
+        WAL (Write-Ahead Logging) mode is stored in the database header, so
+        it only needs setting once per file - switching it rewrites the
+        header, so skip the write when it's already on.
+
+        Args:
+            conn: Open connection to the database
+        """
+        journal_mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+        if journal_mode.lower() != 'wal':
+            conn.execute('PRAGMA journal_mode=WAL')
+            logger.info("Enabled WAL journal mode")
+
+    @staticmethod
+    def _configure_conn(conn: sqlite3.Connection):
+        """
+        Apply session pragmas (these reset on every new connection).
+
+        - synchronous=NORMAL: no fsync per commit (still safe in WAL mode)
+        - 64MB page cache and memory-mapped reads for hot pages
+        - temp tables/indexes kept in memory
+        - busy_timeout so concurrent access waits instead of failing
+        - foreign_keys=ON so ON DELETE CASCADE actually fires
+
+        Args:
+            conn: Newly opened connection
+        """
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-64000")  # Negative = size in KB (~64MB)
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=2147483648")  # 2GB
+        conn.execute("PRAGMA busy_timeout=5000")  # Milliseconds
+        conn.execute("PRAGMA foreign_keys=ON")
+
+        # Keep the WAL file from growing unbounded (~6MB)
+        conn.execute("PRAGMA journal_size_limit=6144000")
+
     def _create_schema(self):
         """
         Create database tables if they don't exist.
@@ -71,25 +265,17 @@ class DatabaseManager:
         1. articles table: Tracks ALL processed RSS articles (prevents duplicates)
         2. funding_announcements table: Stores extracted funding details
         3. Foreign key relationship: Each announcement links to an article
+        4. feed_state table: HTTP cache validators per feed (conditional GET)
         """
         try:
             cursor = self.conn.cursor()
 
+            # Upgrade databases created by older versions first
+            self._migrate_schema()
+
             # Table 1: Articles
             # Purpose: Track all processed RSS articles to avoid re-processing
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    url TEXT UNIQUE NOT NULL,
-                    title TEXT NOT NULL,
-                    source TEXT NOT NULL,
-                    published_date TEXT NOT NULL,
-                    processed_date TEXT NOT NULL,
-                    is_funding_related BOOLEAN NOT NULL,
-                    relevance_score INTEGER DEFAULT 0,
-                    CONSTRAINT unique_url UNIQUE (url)
-                )
-            ''')
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS articles ({_ARTICLES_COLUMNS_SQL})')
 
             # Table 2: Funding Announcements
             # Purpose: Store extracted funding details for digest generation
@@ -103,16 +289,36 @@ class DatabaseManager:
                     location TEXT,
                     industry TEXT,
                     description TEXT,
-                    included_in_digest BOOLEAN DEFAULT 0,
+                    included_in_digest INTEGER NOT NULL DEFAULT 0,
                     extracted_date TEXT NOT NULL,
                     FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
                 )
             ''')
 
+            # Table 3: Feed State
+            # Purpose: Remember each feed's ETag/Last-Modified so unchanged
+            # feeds can answer 304 Not Modified instead of the full document
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    feed_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    last_fetched TEXT NOT NULL
+                )
+            ''')
+
             # Create indexes for faster lookups
+            # Dedupe index: one integer per article instead of the full URL string
+            cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_urlhash
+                ON articles(url_hash)
+            ''')
+
+            # Lookup index for get_known_content_hashes (not unique: two
+            # distinct articles may legitimately share a title and summary)
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_articles_url
-                ON articles(url)
+                CREATE INDEX IF NOT EXISTS idx_articles_content
+                ON articles(content_hash)
             ''')
 
             cursor.execute('''
@@ -125,6 +331,43 @@ class DatabaseManager:
                 ON funding_announcements(included_in_digest)
             ''')
 
+            # Partial index: keeps the funding-article count in get_stats index-only
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_funding
+                ON articles(is_funding_related)
+                WHERE is_funding_related = 1
+            ''')
+
+            # Partial index for get_pending_announcements: holds only the
+            # not-yet-digested rows, so the pending queue stays small however
+            # much history accumulates (supersedes idx_fa_digest_article)
+            cursor.execute('DROP INDEX IF EXISTS idx_fa_digest_article')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_fa_pending
+                ON funding_announcements(article_id)
+                WHERE included_in_digest = 0
+            ''')
+
+            # Indexes for cleanup_old_entries: find old articles by date, and
+            # let the ON DELETE CASCADE find their announcements without a scan
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_processed
+                ON articles(processed_date)
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_fa_article
+                ON funding_announcements(article_id)
+            ''')
+
+            # Gather planner statistics once so SQLite picks the right indexes
+            # (close() runs PRAGMA optimize to keep them fresh afterwards)
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )
+            if cursor.fetchone() is None:
+                cursor.execute('ANALYZE')
+
             self.conn.commit()
             logger.info("Database schema created successfully")
 
@@ -132,6 +375,65 @@ class DatabaseManager:
             logger.error(f"Schema creation error: {e}")
             raise
 
+    def _migrate_schema(self):
+        """
+        Upgrade an existing database to the current schema.
+
+        Older databases stored a UNIQUE constraint on articles.url and have no
+        url_hash column. SQLite can't drop a constraint in place, so the table
+        is rebuilt (create new table, copy rows, drop old, rename) with
+        foreign keys disabled so the copy doesn't cascade-delete announcements.
+        Databases that already have url_hash only need the nullable
+        content_hash column added.
+        """
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(articles)')}
+        if not columns:
+            return  # Fresh database
+
+        if 'url_hash' in columns:
+            if 'content_hash' not in columns:
+                logger.info("Adding content_hash column to articles table")
+                with self.conn:
+                    self.conn.execute('ALTER TABLE articles ADD COLUMN content_hash INTEGER')
+            return
+
+        logger.info("Migrating articles table to url_hash dedupe index")
+
+        self.conn.create_function('url_hash', 1, _url_hash, deterministic=True)
+
+        # Must be changed outside a transaction
+        self.conn.execute('PRAGMA foreign_keys=OFF')
+        try:
+            with self.conn:
+                self.conn.execute('BEGIN')
+                self.conn.execute(f'CREATE TABLE articles_new ({_ARTICLES_COLUMNS_SQL})')
+                self.conn.execute('''
+                    INSERT INTO articles_new
+                    (id, url, url_hash, title, source, published_date,
+                     processed_date, is_funding_related, relevance_score)
+                    SELECT id, url, url_hash(url), title, source, published_date,
+                           processed_date, is_funding_related, relevance_score
+                    FROM articles
+                ''')
+                self.conn.execute('DROP TABLE articles')
+                self.conn.execute('ALTER TABLE articles_new RENAME TO articles')
+        finally:
+            self.conn.execute('PRAGMA foreign_keys=ON')
+
+    def _remember_processed(self, urls: Iterable[str]):
+        """
+        Add URLs to the in-process cache of stored articles.
+
+        The cache is emptied rather than evicted piecemeal once it reaches
+        config.PROCESSED_URL_CACHE_SIZE; misses just fall back to the database.
+
+        Args:
+            urls: URLs known to be in the articles table
+        """
+        if len(self._processed_urls) >= config.PROCESSED_URL_CACHE_SIZE:
+            self._processed_urls.clear()
+        self._processed_urls.update(urls)
+
     def is_article_processed(self, url: str) -> bool:
         """
         Check if an article has already been processed.
@@ -142,15 +444,102 @@ class DatabaseManager:
         Returns:
             True if article exists in database, False otherwise
         """
+        if url in self._processed_urls:
+            return True
+
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT 1 FROM articles WHERE url = ?', (url,))
-            return cursor.fetchone() is not None
+            with self.pool.acquire() as conn:
+                # Hash narrows to one index entry; URL confirms against collisions
+                cursor = conn.execute(
+                    'SELECT 1 FROM articles WHERE url_hash = ? AND url = ?',
+                    (_url_hash(url), url)
+                )
+                found = cursor.fetchone() is not None
+
+            if found:
+                self._remember_processed((url,))
+            return found
 
         except sqlite3.Error as e:
             logger.error(f"Error checking article: {e}")
             return False
 
+    def get_processed_urls(self, urls: List[str]) -> Set[str]:
+        """
+        Return the subset of URLs that have already been processed.
+
+        Bulk version of is_article_processed(): one indexed
+        "url_hash IN (...)" query per chunk of URLs instead of one query per URL.
+        Only exact URL matches count as processed (guards against hash collisions).
+        URLs already in the in-process cache are answered without a query.
+
+        Args:
+            urls: Article URLs to check
+
+        Returns:
+            Set of URLs present in the database
+        """
+        cached = self._processed_urls.intersection(urls)
+        unique_urls = [url for url in dict.fromkeys(urls) if url not in cached]
+        processed = set()
+
+        try:
+            with self.pool.acquire() as conn:
+                for i in range(0, len(unique_urls), _LOOKUP_CHUNK_SIZE):
+                    chunk = unique_urls[i:i + _LOOKUP_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+
+                    cursor = conn.execute(
+                        f'SELECT url FROM articles WHERE url_hash IN ({placeholders})',
+                        [_url_hash(url) for url in chunk]
+                    )
+                    processed.update(row[0] for row in cursor.fetchall())
+
+        except sqlite3.Error as e:
+            logger.error(f"Error checking articles: {e}")
+            # Same fallback as is_article_processed: treat everything as new
+            return set()
+
+        # A colliding hash may return a different URL; keep exact matches only
+        processed.intersection_update(unique_urls)
+        self._remember_processed(processed)
+        return processed | cached
+
+    def get_known_content_hashes(self, hashes: List[int]) -> Set[int]:
+        """
+        Return the subset of content hashes already stored.
+
+        Used to skip articles whose text was already processed under
+        another URL, before running funding detection on them.
+
+        Args:
+            hashes: Content hashes from content_hash()
+
+        Returns:
+            Set of hashes present in the database
+        """
+        unique_hashes = list(dict.fromkeys(hashes))
+        known = set()
+
+        try:
+            with self.pool.acquire() as conn:
+                for i in range(0, len(unique_hashes), _LOOKUP_CHUNK_SIZE):
+                    chunk = unique_hashes[i:i + _LOOKUP_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+
+                    cursor = conn.execute(
+                        f'SELECT DISTINCT content_hash FROM articles WHERE content_hash IN ({placeholders})',
+                        chunk
+                    )
+                    known.update(row[0] for row in cursor.fetchall())
+
+        except sqlite3.Error as e:
+            logger.error(f"Error checking content hashes: {e}")
+            # Treat everything as new rather than dropping articles
+            return set()
+
+        return known
+
     def store_article(
         self,
         url: str,
@@ -158,11 +547,14 @@ class DatabaseManager:
         source: str,
         published_date: str,
         is_funding_related: bool,
-        relevance_score: int = 0
+        relevance_score: int = 0,
+        content_hash: Optional[int] = None
     ) -> Optional[int]:
         """
         Store a new article in the database.
 
+        Thin wrapper around store_articles_bulk() for single inserts.
+
         Args:
             url: Article URL (must be unique)
             title: Article title
@@ -170,33 +562,157 @@ class DatabaseManager:
             published_date: When article was published (ISO format)
             is_funding_related: Whether article matched funding patterns
             relevance_score: Relevance score (0-100)
+            content_hash: Hash of the article text from content_hash()
 
         Returns:
             Article ID if successful, None otherwise
         """
+        article_ids = self.store_articles_bulk([
+            (url, title, source, published_date, int(bool(is_funding_related)),
+             relevance_score, content_hash)
+        ])
+
+        if url not in article_ids:
+            logger.warning(f"Article not stored (duplicate or error): {url}")
+            return None
+
+        logger.debug(f"Stored article: {title} (ID: {article_ids[url]})")
+        return article_ids[url]
+
+    def store_articles_bulk(self, rows: List[Tuple]) -> Dict[str, int]:
+        """
+        Store many articles in a single transaction.
+
+        One commit for the whole batch instead of one per article - the
+        journal sync on commit dominates SQLite insert cost.
+        Duplicate URLs are skipped via INSERT OR IGNORE.
+
+        Args:
+            rows: Tuples of (url, title, source, published_date,
+                  is_funding_related, relevance_score, content_hash);
+                  is_funding_related should be 0/1 to match the INTEGER
+                  column, content_hash may be None
+
+        Returns:
+            Dictionary mapping URL -> article ID for newly inserted articles
+            (duplicates are not included)
+        """
+        if not rows:
+            return {}
+
         try:
-            cursor = self.conn.cursor()
-            processed_date = datetime.now().isoformat()
+            with self.conn:
+                article_ids = self._insert_articles(self.conn.cursor(), rows)
 
-            cursor.execute('''
-                INSERT INTO articles
-                (url, title, source, published_date, processed_date, is_funding_related, relevance_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (url, title, source, published_date, processed_date, is_funding_related, relevance_score))
+            self._remember_processed(article_ids)
 
-            self.conn.commit()
-            article_id = cursor.lastrowid
+            logger.debug(f"Stored {len(article_ids)} articles")
+            return article_ids
 
-            logger.debug(f"Stored article: {title} (ID: {article_id})")
-            return article_id
+        except sqlite3.Error as e:
+            logger.error(f"Error storing articles: {e}")
+            return {}
 
-        except sqlite3.IntegrityError:
-            logger.warning(f"Duplicate article URL: {url}")
-            return None
+    def store_results_bulk(
+        self,
+        article_rows: List[Tuple],
+        announcement_rows: Dict[str, Tuple]
+    ) -> Tuple[Dict[str, int], int]:
+        """
+        Store a run's articles and their funding announcements in one transaction.
+
+        Articles and announcements share a single commit, so the WAL sync is
+        paid once per run and a failure leaves neither half behind (the
+        articles are then retried on the next run instead of being marked
+        processed without their announcements).
+
+        Args:
+            article_rows: Tuples as accepted by store_articles_bulk()
+            announcement_rows: Dictionary mapping article URL -> tuple of
+                (company_name, funding_stage, funding_amount, location,
+                industry, description); announcements for URLs that were
+                not newly inserted are skipped
+
+        Returns:
+            Tuple of (URL -> article ID for inserted articles,
+            number of announcements stored)
+        """
+        if not article_rows:
+            return {}, 0
+
+        try:
+            with self.conn:
+                cursor = self.conn.cursor()
+                article_ids = self._insert_articles(cursor, article_rows)
+                stored = self._insert_announcements(cursor, [
+                    (article_ids[url],) + row
+                    for url, row in announcement_rows.items()
+                    if url in article_ids
+                ])
+
+            self._remember_processed(article_ids)
+            logger.debug(f"Stored {len(article_ids)} articles")
+            if stored:
+                logger.info(f"Stored {stored} funding announcements")
+            return article_ids, stored
 
         except sqlite3.Error as e:
-            logger.error(f"Error storing article: {e}")
-            return None
+            logger.error(f"Error storing results: {e}")
+            return {}, 0
+
+    @staticmethod
+    def _insert_articles(cursor: sqlite3.Cursor, rows: List[Tuple]) -> Dict[str, int]:
+        """
+        Insert article rows inside the caller's transaction.
+
+        Args:
+            cursor: Cursor on the connection holding the open transaction
+            rows: Tuples as accepted by store_articles_bulk()
+
+        Returns:
+            Dictionary mapping URL -> article ID for newly inserted articles
+        """
+        processed_date = datetime.now().isoformat()
+
+        # AUTOINCREMENT ids only grow, so anything above this was inserted by us
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM articles')
+        last_id = cursor.fetchone()[0]
+
+        cursor.executemany(
+            _INSERT_ARTICLE_SQL,
+            (row + (_url_hash(row[0]), processed_date) for row in rows)
+        )
+
+        cursor.execute('SELECT id, url FROM articles WHERE id > ?', (last_id,))
+        article_ids = {row['url']: row['id'] for row in cursor.fetchall()}
+
+        skipped = len(rows) - len(article_ids)
+        if skipped:
+            logger.debug(f"Skipped {skipped} duplicate articles")
+
+        return article_ids
+
+    @staticmethod
+    def _insert_announcements(cursor: sqlite3.Cursor, rows: List[Tuple]) -> int:
+        """
+        Insert funding announcement rows inside the caller's transaction.
+
+        Args:
+            cursor: Cursor on the connection holding the open transaction
+            rows: Tuples as accepted by store_announcements_bulk()
+
+        Returns:
+            Number of announcements inserted
+        """
+        if not rows:
+            return 0
+
+        extracted_date = datetime.now().isoformat()
+        cursor.executemany(
+            _INSERT_ANNOUNCEMENT_SQL,
+            (row + (extracted_date,) for row in rows)
+        )
+        return len(rows)
 
     def store_funding_announcement(
         self,
@@ -227,13 +743,10 @@ class DatabaseManager:
             cursor = self.conn.cursor()
             extracted_date = datetime.now().isoformat()
 
-            cursor.execute('''
-                INSERT INTO funding_announcements
-                (article_id, company_name, funding_stage, funding_amount,
-                 location, industry, description, extracted_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (article_id, company_name, funding_stage, funding_amount,
-                  location, industry, description, extracted_date))
+            cursor.execute(_INSERT_ANNOUNCEMENT_SQL, (
+                article_id, company_name, funding_stage, funding_amount,
+                location, industry, description, extracted_date
+            ))
 
             self.conn.commit()
             announcement_id = cursor.lastrowid
@@ -245,63 +758,83 @@ class DatabaseManager:
             logger.error(f"Error storing funding announcement: {e}")
             return None
 
-    def get_pending_announcements(self, days: int = 1) -> List[Dict]:
+    def store_announcements_bulk(self, rows: List[Tuple]) -> int:
         """
-        Retrieve funding announcements not yet included in a digest.
+        Store many funding announcements in a single transaction.
 
         Args:
-            days: Number of days to look back (1 for daily, 7 for weekly)
+            rows: Tuples of (article_id, company_name, funding_stage,
+                  funding_amount, location, industry, description)
 
         Returns:
-            List of announcement dictionaries with article details
+            Number of announcements stored
         """
+        if not rows:
+            return 0
+
         try:
-            cursor = self.conn.cursor()
+            with self.conn:
+                stored = self._insert_announcements(self.conn.cursor(), rows)
 
-            # Calculate cutoff date
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            logger.info(f"Stored {stored} funding announcements")
+            return stored
 
-            # Join funding_announcements with articles to get full details
-            cursor.execute('''
-                SELECT
-                    fa.id,
-                    fa.company_name,
-                    fa.funding_stage,
-                    fa.funding_amount,
-                    fa.location,
-                    fa.industry,
-                    fa.description,
-                    a.url,
-                    a.title,
-                    a.source,
-                    a.published_date,
-                    a.relevance_score
-                FROM funding_announcements fa
-                JOIN articles a ON fa.article_id = a.id
-                WHERE fa.included_in_digest = 0
-                  AND a.published_date >= ?
-                ORDER BY a.published_date DESC
-            ''', (cutoff_date,))
-
-            # Convert rows to dictionaries
-            announcements = []
-            for row in cursor.fetchall():
-                announcements.append({
-                    'id': row['id'],
-                    'company_name': row['company_name'],
-                    'funding_stage': row['funding_stage'],
-                    'funding_amount': row['funding_amount'],
-                    'location': row['location'],
-                    'industry': row['industry'],
-                    'description': row['description'],
-                    'url': row['url'],
-                    'title': row['title'],
-                    'source': row['source'],
-                    'published_date': row['published_date'],
-                    'relevance_score': row['relevance_score']
-                })
+        except sqlite3.Error as e:
+            logger.error(f"Error storing funding announcements: {e}")
+            return 0
+
+    def get_pending_announcements(self, days: int = 1, limit: int = None) -> List[sqlite3.Row]:
+        """
+        Retrieve funding announcements not yet included in a digest.
+
+        The newest announcements come first, capped at `limit` so a large
+        backlog can't blow up memory or the email size. The rest stay pending.
+
+        Args:
+            days: Number of days to look back (1 for daily, 7 for weekly)
+            limit: Max rows to return (default: config.DIGEST_MAX_ANNOUNCEMENTS)
+
+        Returns:
+            List of announcement rows with article details
+            (sqlite3.Row - supports row['column_name'] like a dictionary)
+        """
+        try:
+            with self.pool.acquire() as conn:
+                cursor = conn.cursor()
+
+                # Calculate cutoff date
+                cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+                limit = limit or config.DIGEST_MAX_ANNOUNCEMENTS
+
+                # Join funding_announcements with articles to get full details
+                cursor.execute('''
+                    SELECT
+                        fa.id,
+                        fa.company_name,
+                        fa.funding_stage,
+                        fa.funding_amount,
+                        fa.location,
+                        fa.industry,
+                        fa.description,
+                        a.url,
+                        a.title,
+                        a.source,
+                        a.published_date,
+                        a.relevance_score
+                    FROM funding_announcements fa
+                    JOIN articles a ON fa.article_id = a.id
+                    WHERE fa.included_in_digest = 0
+                      AND a.published_date >= ?
+                    ORDER BY a.published_date DESC
+                    LIMIT ?
+                ''', (cutoff_date, limit))
+                # sqlite3.Row already supports row['column'] access, so no
+                # per-row dict copy is needed
+                announcements = cursor.fetchall()
 
             logger.info(f"Retrieved {len(announcements)} pending announcements")
+            if len(announcements) == limit:
+                logger.warning(f"Pending announcements capped at {limit}; the rest stay pending")
             return announcements
 
         except sqlite3.Error as e:
@@ -320,71 +853,183 @@ class DatabaseManager:
             return
 
         try:
-            cursor = self.conn.cursor()
+            # One UPDATE per chunk of ids, all in a single transaction
+            with self.conn:
+                for i in range(0, len(announcement_ids), _LOOKUP_CHUNK_SIZE):
+                    chunk = announcement_ids[i:i + _LOOKUP_CHUNK_SIZE]
 
-            # Create placeholders for SQL IN clause
-            placeholders = ','.join('?' * len(announcement_ids))
+                    # Create placeholders for SQL IN clause
+                    placeholders = ','.join('?' * len(chunk))
 
-            cursor.execute(f'''
-                UPDATE funding_announcements
-                SET included_in_digest = 1
-                WHERE id IN ({placeholders})
-            ''', announcement_ids)
+                    self.conn.execute(f'''
+                        UPDATE funding_announcements
+                        SET included_in_digest = 1
+                        WHERE id IN ({placeholders})
+                    ''', chunk)
 
-            self.conn.commit()
             logger.info(f"Marked {len(announcement_ids)} announcements as digested")
 
         except sqlite3.Error as e:
             logger.error(f"Error marking announcements as digested: {e}")
 
-    def cleanup_old_entries(self, days: int = None):
+    def start_cleanup(self, days: int = None) -> threading.Thread:
+        """
+        Run cleanup_old_entries() on a background thread.
+
+        The cleanup borrows a pool connection, so the writer connection stays
+        free for the caller meanwhile; its batched commits only briefly hold
+        the write lock (other writers wait via busy_timeout). join() the
+        returned thread before close().
+
+        Args:
+            days: Passed to cleanup_old_entries()
+
+        Returns:
+            The started thread
+        """
+        thread = threading.Thread(
+            target=self._cleanup_on_pool_connection,
+            args=(days,),
+            name='db-cleanup'
+        )
+        thread.start()
+        return thread
+
+    def _cleanup_on_pool_connection(self, days: Optional[int]):
+        """
+        Thread target for start_cleanup().
+
+        Args:
+            days: Passed to cleanup_old_entries()
+        """
+        with self.pool.acquire() as conn:
+            self.cleanup_old_entries(days, conn=conn)
+
+    def cleanup_old_entries(self, days: int = None, conn: sqlite3.Connection = None):
         """
         Delete old articles and announcements to keep database small.
 
+        Deletes in batches of config.DATABASE_CLEANUP_BATCH_SIZE, committing
+        after each batch, so a large backlog never holds the write lock for
+        long. Afterwards the WAL is checkpointed and truncated to reclaim space.
+
         Args:
             days: Delete entries older than this many days (default: config.DATABASE_CLEANUP_DAYS)
+            conn: Connection to run on (default: the writer connection)
         """
         days = days or config.DATABASE_CLEANUP_DAYS
+        batch_size = config.DATABASE_CLEANUP_BATCH_SIZE
+        conn = conn or self.conn
 
         try:
-            cursor = self.conn.cursor()
+            cursor = conn.cursor()
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            deleted_count = 0
 
             # Delete old articles (funding_announcements cascade delete automatically)
-            cursor.execute('''
-                DELETE FROM articles
-                WHERE processed_date < ?
-            ''', (cutoff_date,))
-
-            deleted_count = cursor.rowcount
-            self.conn.commit()
+            while True:
+                cursor.execute('''
+                    DELETE FROM articles
+                    WHERE id IN (
+                        SELECT id FROM articles
+                        WHERE processed_date < ?
+                        LIMIT ?
+                    )
+                ''', (cutoff_date, batch_size))
+
+                batch_count = cursor.rowcount
+                conn.commit()
+                deleted_count += batch_count
+
+                if batch_count < batch_size:
+                    break
+
+            # Deleted URLs may now reappear as new articles
+            if deleted_count:
+                self._processed_urls.clear()
+
+            # Reclaim WAL space and refresh planner statistics
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            cursor.execute("PRAGMA optimize")
 
             logger.info(f"Cleaned up {deleted_count} articles older than {days} days")
 
         except sqlite3.Error as e:
             logger.error(f"Error cleaning up old entries: {e}")
 
-    def get_stats(self) -> Dict:
+    def get_feed_states(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
         """
-        Get database statistics for logging/monitoring.
+        Load the stored HTTP cache validators for every feed.
 
         Returns:
-            Dictionary with article and announcement counts
+            Dictionary mapping feed URL -> (etag, last_modified)
         """
         try:
-            cursor = self.conn.cursor()
+            with self.pool.acquire() as conn:
+                cursor = conn.execute('SELECT feed_url, etag, last_modified FROM feed_state')
+                return {row['feed_url']: (row['etag'], row['last_modified']) for row in cursor}
+
+        except sqlite3.Error as e:
+            logger.error(f"Error loading feed state: {e}")
+            # Without validators every feed is simply fetched in full
+            return {}
+
+    def update_feed_states(self, states: Dict[str, Tuple[Optional[str], Optional[str]]]):
+        """
+        Save HTTP cache validators for feeds fetched in this run.
+
+        Call only after the feed's articles are stored: once saved, the
+        next fetch may answer 304 and those articles won't be seen again.
+
+        Args:
+            states: Dictionary mapping feed URL -> (etag, last_modified)
+        """
+        if not states:
+            return
+
+        try:
+            last_fetched = datetime.now().isoformat()
 
-            cursor.execute('SELECT COUNT(*) FROM articles')
-            total_articles = cursor.fetchone()[0]
+            with self.conn:
+                self.conn.executemany('''
+                    INSERT OR REPLACE INTO feed_state
+                    (feed_url, etag, last_modified, last_fetched)
+                    VALUES (?, ?, ?, ?)
+                ''', (
+                    (feed_url, etag, last_modified, last_fetched)
+                    for feed_url, (etag, last_modified) in states.items()
+                ))
 
-            cursor.execute('SELECT COUNT(*) FROM articles WHERE is_funding_related = 1')
-            funding_articles = cursor.fetchone()[0]
+            logger.debug(f"Updated feed state for {len(states)} feeds")
 
-            cursor.execute('SELECT COUNT(*) FROM funding_announcements')
-            total_announcements = cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Error updating feed state: {e}")
 
-            cursor.execute('SELECT COUNT(*) FROM funding_announcements WHERE included_in_digest = 1')
-            digested_announcements = cursor.fetchone()[0]
+    def get_stats(self) -> Dict:
+        """
+        Get database statistics for logging/monitoring.
+
+        Returns:
+            Dictionary with article and announcement counts
+        """
+        try:
+            with self.pool.acquire() as conn:
+                cursor = conn.cursor()
+
+                # One statement instead of four round trips
+                cursor.execute('''
+                    SELECT
+                        (SELECT COUNT(*) FROM articles),
+                        (SELECT COUNT(*) FROM articles WHERE is_funding_related = 1),
+                        (SELECT COUNT(*) FROM funding_announcements),
+                        (SELECT COUNT(*) FROM funding_announcements WHERE included_in_digest = 1)
+                ''')
+                (
+                    total_articles,
+                    funding_articles,
+                    total_announcements,
+                    digested_announcements
+                ) = cursor.fetchone()
 
             return {
                 'total_articles': total_articles,
@@ -399,9 +1044,20 @@ class DatabaseManager:
             return {}
 
     def close(self):
-        """Close database connection."""
+        """Close database connections (writer and pool)."""
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+
         if self.conn:
+            try:
+                # Let SQLite refresh query planner statistics if needed
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
+
             self.conn.close()
+            self.conn = None
             logger.info("Database connection closed")
 
     def __enter__(self):
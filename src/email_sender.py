@@ -3,17 +3,28 @@ Email Sender for Venture Funding Monitor
 Generates and sends HTML email digests via Gmail SMTP.
 """
 
+import atexit
+import gzip
 import logging
-import smtplib
 import os
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict
-from jinja2 import Template, Environment, FileSystemLoader
+from typing import List, Dict, Optional
+from jinja2 import (
+    Template, Environment, FileSystemLoader, FileSystemBytecodeCache,
+    MemcachedBytecodeCache, select_autoescape
+)
 
 from src import config
 
+# Optional memcached client for sharing compiled templates between runs on
+# hosts without a persistent disk (pip install pylibmc)
+try:
+    import pylibmc
+except ImportError:
+    pylibmc = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -25,7 +36,7 @@ class EmailSender:
     Uses:
     - Jinja2 for HTML templating
     - smtplib for Gmail SMTP
-    - MIME multipart for HTML + plain text emails
+    - EmailMessage (multipart/alternative) for HTML + plain text emails
 
     Why Gmail SMTP?
     - Free and reliable
@@ -43,16 +54,53 @@ class EmailSender:
         self.template_dir = template_dir
 
         # Set up Jinja2 template environment
+        # Compiled template code is cached (see _create_bytecode_cache), so a
+        # fresh process loads it instead of reparsing; auto_reload=False skips
+        # the mtime check (templates don't change while the monitor is running)
         self.jinja_env = Environment(
             loader=FileSystemLoader(template_dir),
-            autoescape=True  # Prevent XSS in email content
+            # Prevent XSS in the HTML email; the plain-text template is not
+            # HTML, so escaping there would only mangle "&" and quotes
+            autoescape=select_autoescape(disabled_extensions=('txt',), default=True),
+            bytecode_cache=self._create_bytecode_cache(),
+            auto_reload=False
         )
 
+        # Load the digest templates once and reuse them for every render
+        self._digest_template = self.jinja_env.get_template('email_digest.html')
+        self._text_template = self.jinja_env.get_template('email_digest.txt')
+
         # Verify email configuration
         if not config.GMAIL_ADDRESS or not config.GMAIL_APP_PASSWORD:
             logger.error("Email credentials not configured. Check .env file.")
             raise ValueError("GMAIL_ADDRESS and GMAIL_APP_PASSWORD must be set in .env")
 
+        # Persistent SMTP connection, opened on first send and reused after
+        # (TCP + STARTTLS + login costs seconds per connection)
+        self._smtp: Optional['smtplib.SMTP'] = None
+        self._smtp_last_used = 0.0
+        self._smtp_sent = 0
+        atexit.register(self.close)
+
+    def _create_bytecode_cache(self):
+        """
+        Choose where compiled template code is cached.
+
+        Uses memcached when pylibmc is installed and MEMCACHED_SERVERS is set
+        (for scheduled/serverless runs where the local disk doesn't survive
+        between invocations), otherwise a directory on disk.
+
+        Returns:
+            Jinja2 bytecode cache instance
+        """
+        if pylibmc is not None and config.MEMCACHED_SERVERS:
+            logger.debug(f"Caching compiled templates in memcached: {config.MEMCACHED_SERVERS}")
+            client = pylibmc.Client(config.MEMCACHED_SERVERS, binary=True)
+            return MemcachedBytecodeCache(client, prefix='funding_monitor/jinja2/')
+
+        os.makedirs(config.TEMPLATE_CACHE_DIR, exist_ok=True)
+        return FileSystemBytecodeCache(config.TEMPLATE_CACHE_DIR)
+
     def send_digest(
         self,
         announcements: List[Dict],
@@ -68,11 +116,14 @@ class EmailSender:
         Returns:
             True if email sent successfully, False otherwise
         """
+        # One timestamp for the whole digest keeps subject and bodies consistent
+        now = datetime.now()
+
         try:
             # Generate email content
-            subject = self._generate_subject(len(announcements), digest_type)
-            html_content = self._generate_html(announcements, digest_type)
-            plain_content = self._generate_plain_text(announcements, digest_type)
+            subject = self._generate_subject(len(announcements), digest_type, now)
+            html_content = self._generate_html(announcements, digest_type, now)
+            plain_content = self._generate_plain_text(announcements, digest_type, now)
 
             # Send email
             success = self._send_email(subject, html_content, plain_content)
@@ -90,18 +141,19 @@ class EmailSender:
             self._save_backup(html_content, digest_type)
             return False
 
-    def _generate_subject(self, count: int, digest_type: str) -> str:
+    def _generate_subject(self, count: int, digest_type: str, now: Optional[datetime] = None) -> str:
         """
         Generate email subject line.
 
         Args:
             count: Number of funding announcements
             digest_type: 'daily' or 'weekly'
+            now: Digest timestamp (defaults to the current time)
 
         Returns:
             Subject line string
         """
-        date_str = datetime.now().strftime('%Y-%m-%d')
+        date_str = (now or datetime.now()).strftime('%Y-%m-%d')
 
         if digest_type == 'weekly':
             return config.EMAIL_SUBJECT_WEEKLY.format(count=count, date=date_str)
@@ -111,7 +163,8 @@ class EmailSender:
     def _generate_html(
         self,
         announcements: List[Dict],
-        digest_type: str
+        digest_type: str,
+        now: Optional[datetime] = None
     ) -> str:
         """
         Generate HTML email content from template.
@@ -119,20 +172,19 @@ class EmailSender:
         Args:
             announcements: List of funding announcement dictionaries
             digest_type: 'daily' or 'weekly'
+            now: Digest timestamp (defaults to the current time)
 
         Returns:
             HTML string
         """
-        # Load template
-        template = self.jinja_env.get_template('email_digest.html')
-
         # Prepare template variables
+        now = now or datetime.now()
         days = 7 if digest_type == 'weekly' else 1
-        date_str = datetime.now().strftime('%B %d, %Y')
-        generation_time = datetime.now().strftime('%Y-%m-%d %H:%M UTC')
+        date_str = now.strftime('%B %d, %Y')
+        generation_time = now.strftime('%Y-%m-%d %H:%M UTC')
 
         # Render template
-        html_content = template.render(
+        html_content = self._digest_template.render(
             announcements=announcements,
             total_companies=len(announcements),
             days=days,
@@ -146,7 +198,8 @@ class EmailSender:
     def _generate_plain_text(
         self,
         announcements: List[Dict],
-        digest_type: str
+        digest_type: str,
+        now: Optional[datetime] = None
     ) -> str:
         """
         Generate plain text email content as fallback.
@@ -157,49 +210,23 @@ class EmailSender:
         Args:
             announcements: List of funding announcement dictionaries
             digest_type: 'daily' or 'weekly'
+            now: Digest timestamp (defaults to the current time)
 
         Returns:
             Plain text string
         """
+        now = now or datetime.now()
         days = 7 if digest_type == 'weekly' else 1
-        date_str = datetime.now().strftime('%B %d, %Y')
-
-        lines = [
-            f"Venture Funding Digest - {date_str}",
-            "=" * 60,
-            "",
-            f"{len(announcements)} new funding announcement(s) in the last {days} day(s)",
-            "Geographic Focus: UK, Europe & Middle East",
-            "Stages: Seed to Series C | Priority: Fintech & SaaS",
-            "",
-            "=" * 60,
-            ""
-        ]
-
-        if announcements:
-            for i, announcement in enumerate(announcements, 1):
-                lines.extend([
-                    f"{i}. {announcement['company_name']}",
-                    f"   Stage: {announcement['funding_stage']}",
-                    f"   Amount: {announcement['funding_amount']}",
-                    f"   Location: {announcement['location']}",
-                    f"   Industry: {announcement['industry']}",
-                    f"   Description: {announcement['description'][:200]}...",
-                    f"   Read more: {announcement['url']}",
-                    ""
-                ])
-        else:
-            lines.append("No new funding announcements matching your criteria were found in this period.")
-            lines.append("")
+        date_str = now.strftime('%B %d, %Y')
+        generation_time = now.strftime('%Y-%m-%d %H:%M UTC')
 
-        lines.extend([
-            "=" * 60,
-            "Generated automatically by your Venture Funding Monitor",
-            "Sources: TechCrunch, Sifted, VentureBeat, Crunchbase News",
-            f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}"
-        ])
-
-        return "\n".join(lines)
+        return self._text_template.render(
+            announcements=announcements,
+            total_companies=len(announcements),
+            days=days,
+            date=date_str,
+            generation_time=generation_time
+        )
 
     def _send_email(
         self,
@@ -208,7 +235,10 @@ class EmailSender:
         plain_content: str
     ) -> bool:
         """
-        Send email via Gmail SMTP.
+        Send email via Gmail SMTP to every configured recipient.
+
+        Recipients (config.RECIPIENT_EMAILS) share one SMTP transaction per
+        batch of SMTP_MAX_RECIPIENTS, rather than one message each.
 
         Args:
             subject: Email subject line
@@ -218,72 +248,227 @@ class EmailSender:
         Returns:
             True if successful, False otherwise
         """
+        # Imported on first send: preview/dry runs never pay for the email stack
+        import smtplib
+        from email import policy
+        from email.message import EmailMessage
+
+        recipients = config.RECIPIENT_EMAILS
+        if not recipients:
+            logger.error("No recipient configured. Set RECIPIENT_EMAIL in .env file.")
+            return False
+
         try:
-            # Create multipart message (supports both HTML and plain text)
-            message = MIMEMultipart('alternative')
+            # Create message (SMTP policy: CRLF line endings, RFC-compliant headers)
+            message = EmailMessage(policy=policy.SMTP)
             message['Subject'] = subject
             message['From'] = config.GMAIL_ADDRESS
-            message['To'] = config.RECIPIENT_EMAIL
 
-            # Attach plain text and HTML parts
+            # Plain text body plus an HTML alternative (multipart/alternative)
             # Email clients will try to render HTML first, fall back to plain text
-            plain_part = MIMEText(plain_content, 'plain')
-            html_part = MIMEText(html_content, 'html')
+            message.set_content(plain_content)
+            message.add_alternative(html_content, subtype='html')
 
-            message.attach(plain_part)
-            message.attach(html_part)
+            # Reuse the open SMTP session (connects on first use)
+            server = self._get_connection()
 
-            # Connect to Gmail SMTP server
-            logger.info(f"Connecting to Gmail SMTP: {config.SMTP_SERVER}:{config.SMTP_PORT}")
+            # One SMTP transaction delivers to a whole batch of recipients
+            batch_size = config.SMTP_MAX_RECIPIENTS
+            for i in range(0, len(recipients), batch_size):
+                batch = recipients[i:i + batch_size]
 
-            with smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT) as server:
-                # Enable TLS encryption
-                server.starttls()
+                # Be gentle with Gmail's rate limits between batches
+                if i > 0:
+                    time.sleep(config.SMTP_BATCH_DELAY)
 
-                # Login with app password
-                server.login(config.GMAIL_ADDRESS, config.GMAIL_APP_PASSWORD)
+                del message['To']
+                message['To'] = ', '.join(batch)
+                self._stream_message(server, message, config.GMAIL_ADDRESS, batch)
 
-                # Send email
-                server.send_message(message)
+                self._smtp_sent += 1
+                self._smtp_last_used = time.monotonic()
 
-            logger.info(f"Email sent successfully to {config.RECIPIENT_EMAIL}")
+            logger.info(f"Email sent successfully to {', '.join(recipients)}")
             return True
 
         except smtplib.SMTPAuthenticationError as e:
             logger.error(f"SMTP authentication failed: {e}")
             logger.error("Check your Gmail address and app password in .env file")
+            self.close()
             return False
 
         except smtplib.SMTPException as e:
             logger.error(f"SMTP error: {e}")
+            self.close()  # Start from a fresh connection next time
             return False
 
         except Exception as e:
             logger.error(f"Unexpected error sending email: {e}")
+            self.close()
             return False
 
+    def _stream_message(self, server: 'smtplib.SMTP', message, from_addr: str, to_addrs: List[str]):
+        """
+        Send a message by serializing it straight onto the SMTP socket.
+
+        smtplib's send_message() flattens the whole message into one bytes
+        object before sending; here the MIME generator writes through the
+        socket's buffered file instead, so the serialized body is never held
+        in memory all at once.
+
+        Args:
+            server: Connected, authenticated SMTP session
+            message: Email message to send
+            from_addr: Envelope sender
+            to_addrs: Envelope recipients
+
+        Raises:
+            smtplib.SMTPException: If the server rejects the sender, every
+                recipient, or the message data
+        """
+        import smtplib
+        from email.generator import BytesGenerator
+
+        server.ehlo_or_helo_if_needed()
+
+        # Envelope: MAIL FROM + RCPT TO
+        code, resp = server.mail(from_addr)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+
+        refused = {}
+        for addr in to_addrs:
+            code, resp = server.rcpt(addr)
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+        if len(refused) == len(to_addrs):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, resp = server.docmd('DATA')
+        if code != 354:
+            server.rset()
+            raise smtplib.SMTPDataError(code, resp)
+
+        # Message body: generated with CRLF line endings, dot-stuffed on the fly
+        with server.sock.makefile('wb') as sock_file:
+            writer = _DotStuffingWriter(sock_file)
+            BytesGenerator(writer, policy=message.policy.clone(linesep='\r\n')).flatten(message)
+            writer.finish()
+
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+
+        if refused:
+            logger.warning(f"Some recipients were refused: {refused}")
+
+    def _get_connection(self) -> 'smtplib.SMTP':
+        """
+        Return a live, authenticated SMTP connection.
+
+        The open connection is reused unless it has been idle longer than
+        SMTP_IDLE_TIMEOUT, has sent SMTP_MAX_MESSAGES_PER_CONNECTION messages,
+        or fails a NOOP liveness check - then a new one is opened.
+
+        Returns:
+            Connected smtplib.SMTP instance
+
+        Raises:
+            smtplib.SMTPException: If connecting or logging in fails
+        """
+        import smtplib
+
+        if self._smtp is not None:
+            idle = time.monotonic() - self._smtp_last_used
+
+            if idle > config.SMTP_IDLE_TIMEOUT or self._smtp_sent >= config.SMTP_MAX_MESSAGES_PER_CONNECTION:
+                self.close()
+            else:
+                try:
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except (smtplib.SMTPException, OSError):
+                    pass  # Server dropped the connection, reconnect below
+                self.close()
+
+        # Connect to Gmail SMTP server
+        logger.info(f"Connecting to Gmail SMTP: {config.SMTP_SERVER}:{config.SMTP_PORT}")
+
+        server = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT, timeout=config.SMTP_TIMEOUT)
+        try:
+            # Enable TLS encryption
+            server.starttls()
+
+            # Login with app password
+            server.login(config.GMAIL_ADDRESS, config.GMAIL_APP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+
+        self._smtp = server
+        self._smtp_last_used = time.monotonic()
+        self._smtp_sent = 0
+        return server
+
+    def close(self):
+        """
+        Close the SMTP connection (if open).
+
+        Safe to call multiple times; also registered with atexit.
+        """
+        if self._smtp is None:
+            return
+
+        import smtplib
+
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()  # Server already gone; just drop the socket
+
+        self._smtp = None
+
     def _save_backup(self, html_content: str, digest_type: str):
         """
         Save email HTML to backup file in case of sending failure.
 
-        This allows manual recovery if email sending fails.
+        This allows manual recovery if email sending fails. The file is
+        gzip-compressed (HTML shrinks ~10x) and written on a background
+        thread so the failure path doesn't wait on disk I/O; the thread is
+        non-daemon, so the interpreter still finishes the write before exit.
 
         Args:
             html_content: HTML email content
             digest_type: 'daily' or 'weekly'
         """
+        # Generate filename with timestamp
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        filename = f"{digest_type}_digest_{timestamp}.html.gz"
+        filepath = os.path.join('backup_digests', filename)
+
+        threading.Thread(
+            target=self._write_backup,
+            args=(filepath, html_content),
+            name='digest-backup'
+        ).start()
+
+    @staticmethod
+    def _write_backup(filepath: str, html_content: str):
+        """
+        Write a gzip-compressed backup file (runs on a background thread).
+
+        Args:
+            filepath: Destination path (.html.gz)
+            html_content: HTML email content
+        """
         try:
             # Create backup directory
-            backup_dir = 'backup_digests'
-            os.makedirs(backup_dir, exist_ok=True)
-
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-            filename = f"{digest_type}_digest_{timestamp}.html"
-            filepath = os.path.join(backup_dir, filename)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-            # Write HTML to file
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Write compressed HTML to file (open with: zcat / gunzip)
+            with gzip.open(filepath, 'wt', encoding='utf-8', compresslevel=6) as f:
                 f.write(html_content)
 
             logger.info(f"Saved backup digest to {filepath}")
@@ -292,6 +477,39 @@ class EmailSender:
             logger.error(f"Failed to save backup: {e}")
 
 
+class _DotStuffingWriter:
+    """
+    File-like wrapper that applies SMTP transparency rules while writing.
+
+    Lines beginning with '.' get an extra '.' (RFC 5321 section 4.5.2), and
+    finish() writes the terminating <CRLF>.<CRLF>. Tracks whether the last
+    write ended a line, so a '.' at the start of the next chunk is handled.
+    """
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._at_line_start = True
+
+    def write(self, data: bytes) -> int:
+        if not data:
+            return 0
+
+        stuffed = data.replace(b'\n.', b'\n..')
+        if self._at_line_start and stuffed.startswith(b'.'):
+            stuffed = b'.' + stuffed
+
+        self._fp.write(stuffed)
+        self._at_line_start = data.endswith(b'\n')
+        return len(data)
+
+    def finish(self):
+        """Terminate the DATA section and flush to the socket."""
+        if not self._at_line_start:
+            self._fp.write(b'\r\n')
+        self._fp.write(b'.\r\n')
+        self._fp.flush()
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Configure logging for testing
@@ -344,4 +562,4 @@ if __name__ == "__main__":
     print("\nTo send actual emails, configure your .env file with:")
     print("- GMAIL_ADDRESS")
     print("- GMAIL_APP_PASSWORD")
-    print("- RECIPIENT_EMAIL")
+    print("- RECIPIENT_EMAIL (comma-separated for several recipients)")
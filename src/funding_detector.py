@@ -4,15 +4,96 @@ Detects funding announcements in RSS articles using regex patterns.
 Extracts company name, funding stage, amount, location, and industry.
 """
 
+import functools
 import logging
+import multiprocessing
+import os
 import re
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
 
 from src import config
 
+if TYPE_CHECKING:
+    # Annotation only: keeps the detector (and its pool workers) from
+    # importing requests/feedparser
+    from src.rss_fetcher import Article
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Score awarded for each named group of the combined location/industry patterns
+LOCATION_SCORES = {
+    'UK': config.SCORE_UK_LOCATION,
+    'EU': config.SCORE_EU_LOCATION,
+    'ME': config.SCORE_ME_LOCATION,
+}
+
+INDUSTRY_SCORES = {
+    'Fintech': config.SCORE_FINTECH,
+    'SaaS': config.SCORE_SAAS,
+    'Tech': config.SCORE_TECH,
+}
+
+# One bit per named group of config.ARTICLE_SCAN_PATTERN. Within each category
+# the bits follow priority order, so the lowest set bit is the best match.
+_SCAN_GROUPS = [
+    'Funding',
+    'Seed', 'SeriesA', 'SeriesB', 'SeriesC',
+    'UK', 'EU', 'ME',
+    'Fintech', 'SaaS', 'Tech',
+]
+SCAN_FLAGS = {name: 1 << i for i, name in enumerate(_SCAN_GROUPS)}
+SCAN_FLAGS['SeedFunding'] = SCAN_FLAGS['Seed'] | SCAN_FLAGS['Funding']
+
+# Reverse lookup: single bit -> group name
+_FLAG_GROUPS = {1 << i: name for i, name in enumerate(_SCAN_GROUPS)}
+
+# Bits belonging to each category
+FUNDING_FLAG = SCAN_FLAGS['Funding']
+STAGE_MASK = sum(SCAN_FLAGS[name] for name in ('Seed', 'SeriesA', 'SeriesB', 'SeriesC'))
+LOCATION_MASK = sum(SCAN_FLAGS[name] for name in LOCATION_SCORES)
+INDUSTRY_MASK = sum(SCAN_FLAGS[name] for name in INDUSTRY_SCORES)
+
+# Top-priority group of every category: once all are seen, further matches
+# can't change the score or any extracted field
+SATURATED_FLAGS = SCAN_FLAGS['Funding'] | SCAN_FLAGS['Seed'] | SCAN_FLAGS['UK'] | SCAN_FLAGS['Fintech']
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=config.SCORE_CACHE_SIZE)
+def _clean_company_name(name: str) -> str:
+    """
+    Clean extracted company name.
+
+    Removes trailing punctuation, extra spaces, etc.
+
+    Args:
+        name: Raw extracted name
+
+    Returns:
+        Cleaned company name
+    """
+    # Remove trailing punctuation
+    name = name.rstrip('.,;:')
+    # Remove extra spaces
+    name = _WHITESPACE_RE.sub(' ', name)
+    return name.strip()
+
+
+class FundingAnnouncement(NamedTuple):
+    """Funding details extracted from one article (see analyze_article)."""
+    company_name: str
+    funding_stage: str
+    funding_amount: str
+    location: str
+    industry: str
+    description: str
+    relevance_score: int
+    url: str
+    title: str
+    source: str
+
 
 class FundingDetector:
     """
@@ -23,6 +104,9 @@ class FundingDetector:
     2. Extract company name, stage, amount, location, industry
     3. Calculate relevance score based on your criteria
 
+    Holds no per-instance state: the helpers are static methods (several
+    memoized per process), and an instance is just a handle for callers.
+
     Why regex instead of LLM?
     - Free (no API costs)
     - Fast (processes hundreds of articles quickly)
@@ -30,24 +114,40 @@ class FundingDetector:
     - Good enough for structured announcements in tech news
     """
 
-    def analyze_article(self, article: Dict) -> Optional[Dict]:
+    def analyze_article(
+        self,
+        article: 'Article',
+        _has_funding_terms=config.FUNDING_TERMS_PATTERN.search
+    ) -> Optional[FundingAnnouncement]:
         """
         Analyze an article to detect funding announcements.
 
         Args:
-            article: Dictionary with 'title', 'description', 'url', 'source'
+            article: Article with title, description, url and source
+            _has_funding_terms: Pre-bound pattern search (fast local lookup
+                in the per-article hot path; not meant to be passed)
 
         Returns:
-            Dictionary with extracted funding details and score,
+            FundingAnnouncement with extracted funding details and score,
             or None if not a funding announcement
         """
-        # Combine title and description for full text analysis
-        title = article.get('title', '')
-        description = article.get('description', '')
-        full_text = f"{title}. {description}"
+        title = article.title
+        description = article.description
+
+        # Fast reject: most feed items aren't about funding at all, so check
+        # for a funding keyword or stage (title first, it's short) before
+        # running the full scan
+        if config.REQUIRE_FUNDING_TERMS and not (
+            _has_funding_terms(title) or _has_funding_terms(description)
+        ):
+            logger.debug(f"Article has no funding terms: {title[:50]}")
+            return None
+
+        # One pass over the text finds every keyword category
+        flags, found = self._scan(title, description)
 
         # Calculate relevance score
-        score = self._calculate_score(full_text)
+        score = self._calculate_score(flags)
 
         # Only process if score meets threshold
         if score < config.RELEVANCE_THRESHOLD:
@@ -56,29 +156,123 @@ class FundingDetector:
 
         # Extract funding details
         company_name = self._extract_company_name(title)
-        funding_stage = self._extract_funding_stage(full_text)
-        funding_amount = self._extract_funding_amount(full_text)
-        location = self._extract_location(full_text)
-        industry = self._extract_industry(full_text)
-
-        # Build result dictionary
-        result = {
-            'company_name': company_name or 'Unknown',
-            'funding_stage': funding_stage or 'Unknown',
-            'funding_amount': funding_amount or 'Not specified',
-            'location': location or 'Unknown',
-            'industry': industry or 'Tech',
-            'description': description[:500],  # Limit length
-            'relevance_score': score,
-            'url': article.get('url', ''),
-            'title': title,
-            'source': article.get('source', '')
-        }
+        funding_stage = self._extract_funding_stage(flags)
+        funding_amount = self._extract_funding_amount(title, description)
+        location = self._extract_location(flags, found)
+        industry = self._extract_industry(flags, found)
+
+        # Build result
+        result = FundingAnnouncement(
+            company_name=company_name or 'Unknown',
+            funding_stage=funding_stage or 'Unknown',
+            funding_amount=funding_amount or 'Not specified',
+            location=location or 'Unknown',
+            industry=industry or 'Tech',
+            description=description[:500],  # Limit length
+            relevance_score=score,
+            url=article.url,
+            title=title,
+            source=article.source
+        )
 
         logger.info(f"Detected funding: {company_name} - {funding_stage} (score: {score})")
         return result
 
-    def _calculate_score(self, text: str) -> int:
+    def analyze_articles(self, articles: List['Article']) -> List[FundingAnnouncement]:
+        """
+        Analyze a batch of articles, keeping only funding announcements.
+
+        Batches of config.DETECTION_PARALLEL_MIN_ARTICLES or more are spread
+        over a process pool (one FundingDetector per worker) when more than
+        one CPU is available; smaller batches run in-process.
+
+        Args:
+            articles: List of articles (see analyze_article)
+
+        Returns:
+            List of FundingAnnouncement tuples, in input order
+        """
+        processes = os.cpu_count() or 1
+        if processes > 1 and len(articles) >= config.DETECTION_PARALLEL_MIN_ARTICLES:
+            logger.info(f"Analyzing {len(articles)} articles in {processes} processes")
+            with multiprocessing.Pool(processes, initializer=_init_worker) as pool:
+                # imap keeps input order
+                results = pool.imap(_analyze_in_worker, articles, chunksize=config.DETECTION_CHUNK_SIZE)
+                return [result for result in results if result is not None]
+
+        analyze = self.analyze_article  # Bind once instead of per article
+        return [result for result in map(analyze, articles) if result is not None]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=config.SCORE_CACHE_SIZE)
+    def _scan(
+        title: str,
+        description: str,
+        _finditer=config.ARTICLE_SCAN_PATTERN.finditer,
+        _scan_flags=SCAN_FLAGS,
+        _saturated=SATURATED_FLAGS
+    ) -> Tuple[int, Dict[str, str]]:
+        """
+        Scan article text once for all keyword categories.
+
+        Every match of config.ARTICLE_SCAN_PATTERN sets the bit of its named
+        group (see SCAN_FLAGS), and the first matched text of each group is
+        kept for the extractors. Scanning stops as soon as the top-priority
+        group of every category has been seen (maximum score, and every
+        extracted field already final).
+
+        Title and description are scanned one after the other rather than
+        joined into a new string; no pattern can match across the join, so
+        the result is the same.
+
+        Pure function of the text, so results are memoized: the same story
+        syndicated across several feeds is only scanned once per process.
+
+        The pattern and lookup tables are bound as default arguments so the
+        per-match loop reads locals instead of module/config attributes.
+
+        Args:
+            title: Article title
+            description: Article description
+
+        Returns:
+            Tuple of (bitmask of matched groups, group name -> first matched text)
+        """
+        flags = 0
+        found = {}
+
+        for text in (title, description):
+            for match in _finditer(text):
+                group = match.lastgroup
+                flags |= _scan_flags[group]
+                if group not in found:
+                    found[group] = match.group(0)
+
+                    # Stop early once nothing left in the text could matter
+                    if flags & _saturated == _saturated:
+                        return flags, found
+
+        return flags, found
+
+    @staticmethod
+    def _best_group(flags: int, mask: int) -> Optional[str]:
+        """
+        Return the highest-priority group set in one category of the bitmask.
+
+        Args:
+            flags: Bitmask from _scan()
+            mask: Bits of the category (e.g. LOCATION_MASK)
+
+        Returns:
+            Group name, or None if nothing in the category matched
+        """
+        bits = flags & mask
+        if not bits:
+            return None
+        return _FLAG_GROUPS[bits & -bits]  # Lowest set bit = best priority
+
+    @staticmethod
+    def _calculate_score(flags: int) -> int:
         """
         Calculate relevance score for an article (0-100).
 
@@ -91,7 +285,7 @@ class FundingDetector:
         - Other tech: +10
 
         Args:
-            text: Article title + description
+            flags: Bitmask of matched groups from _scan()
 
         Returns:
             Score from 0-100
@@ -99,206 +293,177 @@ class FundingDetector:
         score = 0
 
         # 1. Check for funding keywords (+30)
-        if config.FUNDING_KEYWORDS_PATTERN.search(text):
+        if flags & FUNDING_FLAG:
             score += config.SCORE_FUNDING_KEYWORDS
 
         # 2. Check for funding stage (+20)
-        for stage, pattern in config.FUNDING_STAGES.items():
-            if pattern.search(text):
-                score += config.SCORE_FUNDING_STAGE
-                break  # Only count once
+        if flags & STAGE_MASK:
+            score += config.SCORE_FUNDING_STAGE
 
         # 3. Check location (UK: +30, EU/ME: +15)
-        if config.UK_KEYWORDS_PATTERN.search(text):
-            score += config.SCORE_UK_LOCATION
-        elif config.EU_KEYWORDS_PATTERN.search(text):
-            score += config.SCORE_EU_LOCATION
-        elif config.ME_KEYWORDS_PATTERN.search(text):
-            score += config.SCORE_ME_LOCATION
+        location = FundingDetector._best_group(flags, LOCATION_MASK)
+        if location:
+            score += LOCATION_SCORES[location]
 
         # 4. Check industry (priority: fintech/SaaS)
-        if config.FINTECH_KEYWORDS_PATTERN.search(text):
-            score += config.SCORE_FINTECH
-        elif config.SAAS_KEYWORDS_PATTERN.search(text):
-            score += config.SCORE_SAAS
-        elif config.TECH_KEYWORDS_PATTERN.search(text):
-            score += config.SCORE_TECH
+        industry = FundingDetector._best_group(flags, INDUSTRY_MASK)
+        if industry:
+            score += INDUSTRY_SCORES[industry]
 
         return min(score, 100)  # Cap at 100
 
-    def _extract_company_name(self, title: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=config.SCORE_CACHE_SIZE)
+    def _extract_company_name(title: str) -> Optional[str]:
         """
         Extract company name from article title.
 
-        Tries multiple patterns in priority order:
+        Tries these title shapes in priority order (one combined pattern):
         1. "CompanyName raises $X"
         2. "CompanyName, a [description], raises $X"
         3. "CompanyName has raised"
 
+        Memoized per title (syndicated stories repeat across feeds).
+
         Args:
             title: Article title
 
         Returns:
             Company name or None if not found
         """
-        for pattern in config.COMPANY_NAME_PATTERNS:
-            match = pattern.search(title)
-            if match:
-                company_name = match.group(1).strip()
-                # Clean up common issues
-                company_name = self._clean_company_name(company_name)
-                logger.debug(f"Extracted company name: {company_name}")
-                return company_name
+        match = config.COMPANY_NAME_PATTERN.search(title)
+        if match:
+            company_name = match.group(match.lastgroup).strip()
+            # Clean up common issues
+            company_name = _clean_company_name(company_name)
+            logger.debug(f"Extracted company name: {company_name}")
+            return company_name
 
         logger.debug(f"Could not extract company name from: {title}")
         return None
 
-    def _clean_company_name(self, name: str) -> str:
-        """
-        Clean extracted company name.
-
-        Removes trailing punctuation, extra spaces, etc.
-
-        Args:
-            name: Raw extracted name
-
-        Returns:
-            Cleaned company name
-        """
-        # Remove trailing punctuation
-        name = name.rstrip('.,;:')
-        # Remove extra spaces
-        name = re.sub(r'\s+', ' ', name)
-        return name.strip()
-
-    def _extract_funding_stage(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _extract_funding_stage(flags: int) -> Optional[str]:
         """
         Extract funding stage (Seed, Series A/B/C).
 
+        Priority: Seed > Series A > Series B > Series C
+
         Args:
-            text: Article text
+            flags: Bitmask of matched groups from _scan()
 
         Returns:
             Funding stage or None if not found
         """
-        for stage, pattern in config.FUNDING_STAGES.items():
-            if pattern.search(text):
-                logger.debug(f"Extracted funding stage: {stage}")
-                return stage
+        group = FundingDetector._best_group(flags, STAGE_MASK)
+        if group:
+            stage = config.FUNDING_STAGE_NAMES[group]
+            logger.debug(f"Extracted funding stage: {stage}")
+            return stage
 
         return None
 
-    def _extract_funding_amount(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _extract_funding_amount(
+        title: str,
+        description: str,
+        _search=config.AMOUNT_PATTERN.search
+    ) -> Optional[str]:
         """
         Extract funding amount from text.
 
         Handles formats like:
-        - $10M, £5m, €20B
-        - $10 million, £5.5 million
-        - 10 million dollars
+        - $10M, £5m, €20B, $500k
+        - $10 million, £5.5 million, $500 thousand
+        - 10 million dollars, 500 thousand euros
 
         Args:
-            text: Article text
+            title: Article title (checked first)
+            description: Article description
 
         Returns:
             Funding amount string or None if not found
         """
-        for pattern in config.AMOUNT_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                # Extract matched groups
-                if len(match.groups()) == 2:
-                    amount, unit = match.groups()
-                    # Normalize unit
-                    unit = unit.lower()
-                    if unit.startswith('m'):
-                        unit_normalized = 'million'
-                    elif unit.startswith('b'):
-                        unit_normalized = 'billion'
-                    elif unit.startswith('k'):
-                        unit_normalized = 'thousand'
-                    else:
-                        unit_normalized = unit
-
-                    result = f"${amount}{unit_normalized[0].upper()}"  # e.g., "$10M"
-                    logger.debug(f"Extracted funding amount: {result}")
-                    return result
-
-                elif len(match.groups()) == 3:
-                    # Format: "10 million dollars"
-                    amount, unit, currency = match.groups()
-                    result = f"${amount}{unit[0].upper()}"  # e.g., "$10M"
-                    logger.debug(f"Extracted funding amount: {result}")
-                    return result
+        match = _search(title) or _search(description)
+        if not match:
+            return None
 
-        return None
+        # Whichever format matched, its unit group closed last
+        if match.lastgroup == 'unit1':
+            # Format: "$10M", "£5 million"
+            amount, unit = match.group('num1', 'unit1')
+        else:
+            # Format: "10 million dollars"
+            amount, unit = match.group('num2', 'unit2')
+
+        # Normalize unit: million -> M, billion -> B, k/thousand -> K
+        result = f"${amount}{config.AMOUNT_UNIT_SUFFIXES[unit[0].lower()]}"  # e.g., "$10M"
+        logger.debug(f"Extracted funding amount: {result}")
+        return result
 
-    def _extract_location(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _extract_location(flags: int, found: Dict[str, str]) -> Optional[str]:
         """
         Extract geographic location from text.
 
         Priority: UK > Europe > Middle East
 
         Args:
-            text: Article text
+            flags: Bitmask of matched groups from _scan()
+            found: First matched text of each group from _scan()
 
         Returns:
             Location string or None if not found
         """
-        # Check UK first (highest priority)
-        uk_match = config.UK_KEYWORDS_PATTERN.search(text)
-        if uk_match:
-            location = uk_match.group(0)
-            logger.debug(f"Extracted location: {location} (UK)")
-            return location
-
-        # Check Europe
-        eu_match = config.EU_KEYWORDS_PATTERN.search(text)
-        if eu_match:
-            location = eu_match.group(0)
-            logger.debug(f"Extracted location: {location} (Europe)")
-            return location
-
-        # Check Middle East
-        me_match = config.ME_KEYWORDS_PATTERN.search(text)
-        if me_match:
-            location = me_match.group(0)
-            logger.debug(f"Extracted location: {location} (Middle East)")
+        group = FundingDetector._best_group(flags, LOCATION_MASK)
+        if group:
+            location = found[group]
+            logger.debug(f"Extracted location: {location} ({group})")
             return location
 
         return None
 
-    def _extract_industry(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _extract_industry(flags: int, found: Dict[str, str]) -> Optional[str]:
         """
         Extract industry/sector from text.
 
         Priority: Fintech > SaaS > Other Tech
 
         Args:
-            text: Article text
+            flags: Bitmask of matched groups from _scan()
+            found: First matched text of each group from _scan()
 
         Returns:
             Industry string or None if not found
         """
-        # Check fintech first (highest priority)
-        if config.FINTECH_KEYWORDS_PATTERN.search(text):
-            logger.debug("Extracted industry: Fintech")
-            return "Fintech"
-
-        # Check SaaS
-        if config.SAAS_KEYWORDS_PATTERN.search(text):
-            logger.debug("Extracted industry: SaaS")
-            return "SaaS"
-
-        # Check other tech
-        tech_match = config.TECH_KEYWORDS_PATTERN.search(text)
-        if tech_match:
-            # Extract the specific tech keyword
-            tech_type = tech_match.group(0)
-            logger.debug(f"Extracted industry: {tech_type}")
-            return tech_type.capitalize()
+        group = FundingDetector._best_group(flags, INDUSTRY_MASK)
+        if not group:
+            return None
 
-        return None
+        if group == 'Tech':
+            # Report the specific tech keyword
+            industry = found[group].capitalize()
+        else:
+            industry = group
+
+        logger.debug(f"Extracted industry: {industry}")
+        return industry
+
+
+# Detector owned by each worker process of the analyze_articles() pool
+_worker_detector = None
+
+
+def _init_worker():
+    """Create the worker process's detector (pool initializer)."""
+    global _worker_detector
+    _worker_detector = FundingDetector()
+
+
+def _analyze_in_worker(article: 'Article') -> Optional[FundingAnnouncement]:
+    """Analyze one article in a pool worker (see FundingDetector.analyze_articles)."""
+    return _worker_detector.analyze_article(article)
 
 
 # Example usage and testing
@@ -309,42 +474,46 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+    from src.rss_fetcher import Article
+
     # Test detector with sample articles
     detector = FundingDetector()
 
     # Test case 1: Clear funding announcement
-    test_article_1 = {
-        'title': 'London fintech startup Acme raises $10M Series A',
-        'description': 'Acme, a London-based fintech company, has secured $10 million in Series A funding to expand its payment platform.',
-        'url': 'https://example.com/article1',
-        'source': 'TechCrunch'
-    }
+    test_article_1 = Article(
+        title='London fintech startup Acme raises $10M Series A',
+        description='Acme, a London-based fintech company, has secured $10 million in Series A funding to expand its payment platform.',
+        url='https://example.com/article1',
+        published_date='2024-01-01T00:00:00',
+        source='TechCrunch'
+    )
 
     print("Test Article 1:")
-    print(f"Title: {test_article_1['title']}")
+    print(f"Title: {test_article_1.title}")
     result = detector.analyze_article(test_article_1)
     if result:
         print(f"✓ Detected funding announcement!")
-        print(f"  Company: {result['company_name']}")
-        print(f"  Stage: {result['funding_stage']}")
-        print(f"  Amount: {result['funding_amount']}")
-        print(f"  Location: {result['location']}")
-        print(f"  Industry: {result['industry']}")
-        print(f"  Score: {result['relevance_score']}")
+        print(f"  Company: {result.company_name}")
+        print(f"  Stage: {result.funding_stage}")
+        print(f"  Amount: {result.funding_amount}")
+        print(f"  Location: {result.location}")
+        print(f"  Industry: {result.industry}")
+        print(f"  Score: {result.relevance_score}")
     else:
         print("✗ Not detected as funding announcement")
 
     # Test case 2: Non-funding article
     print("\n" + "="*50 + "\n")
-    test_article_2 = {
-        'title': 'Apple releases new iPhone features',
-        'description': 'Apple announced new features for the iPhone today, including improved camera capabilities.',
-        'url': 'https://example.com/article2',
-        'source': 'TechCrunch'
-    }
+    test_article_2 = Article(
+        title='Apple releases new iPhone features',
+        description='Apple announced new features for the iPhone today, including improved camera capabilities.',
+        url='https://example.com/article2',
+        published_date='2024-01-01T00:00:00',
+        source='TechCrunch'
+    )
 
     print("Test Article 2:")
-    print(f"Title: {test_article_2['title']}")
+    print(f"Title: {test_article_2.title}")
     result = detector.analyze_article(test_article_2)
     if result:
         print(f"✓ Detected funding announcement (unexpected!)")
@@ -353,23 +522,24 @@ if __name__ == "__main__":
 
     # Test case 3: Middle East startup
     print("\n" + "="*50 + "\n")
-    test_article_3 = {
-        'title': 'Dubai-based SaaS company TechCorp secures $25M Series B',
-        'description': 'TechCorp, a Dubai-based B2B software company, has closed a $25 million Series B round led by regional investors.',
-        'url': 'https://example.com/article3',
-        'source': 'VentureBeat'
-    }
+    test_article_3 = Article(
+        title='Dubai-based SaaS company TechCorp secures $25M Series B',
+        description='TechCorp, a Dubai-based B2B software company, has closed a $25 million Series B round led by regional investors.',
+        url='https://example.com/article3',
+        published_date='2024-01-01T00:00:00',
+        source='VentureBeat'
+    )
 
     print("Test Article 3:")
-    print(f"Title: {test_article_3['title']}")
+    print(f"Title: {test_article_3.title}")
     result = detector.analyze_article(test_article_3)
     if result:
         print(f"✓ Detected funding announcement!")
-        print(f"  Company: {result['company_name']}")
-        print(f"  Stage: {result['funding_stage']}")
-        print(f"  Amount: {result['funding_amount']}")
-        print(f"  Location: {result['location']}")
-        print(f"  Industry: {result['industry']}")
-        print(f"  Score: {result['relevance_score']}")
+        print(f"  Company: {result.company_name}")
+        print(f"  Stage: {result.funding_stage}")
+        print(f"  Amount: {result.funding_amount}")
+        print(f"  Location: {result.location}")
+        print(f"  Industry: {result.industry}")
+        print(f"  Score: {result.relevance_score}")
     else:
         print("✗ Not detected as funding announcement")
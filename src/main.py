@@ -3,34 +3,61 @@ Main orchestration script for Venture Funding Monitor
 Coordinates RSS fetching, funding detection, database storage, and email sending.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import List
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src import config
-from src.rss_fetcher import RSSFetcher
-from src.funding_detector import FundingDetector
-from src.data_manager import DatabaseManager
+from src.rss_fetcher import Article, RSSFetcher
+from src.funding_detector import FundingAnnouncement, FundingDetector
+from src.data_manager import DatabaseManager, content_hash
 from src.email_sender import EmailSender
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('funding_monitor.log')
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging():
+    """
+    Send log output to the console and a rotating log file.
+
+    Called from main() rather than at import time, so importing this module
+    doesn't attach handlers or create the log file. Records go through a
+    queue: the workflow only enqueues them, and a background listener
+    thread does the console and disk writes.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler = logging.handlers.RotatingFileHandler(
+        config.LOG_FILE,
+        maxBytes=config.LOG_MAX_BYTES,
+        backupCount=config.LOG_BACKUP_COUNT,
+        delay=True  # Don't create the file until the first record
+    )
+    for handler in (console_handler, file_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush queued records on exit (including sys.exit in main)
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
 class FundingMonitor:
     """
     Main controller class for the Venture Funding Monitor.
@@ -51,8 +78,8 @@ class FundingMonitor:
         self.db = DatabaseManager()
         self.email_sender = EmailSender()
 
-        # Get digest type from environment or default to daily
-        self.digest_type = os.getenv('DIGEST_TYPE', 'daily')
+        # Get digest type from environment (.env) or default to daily
+        self.digest_type = config.DIGEST_TYPE
 
     def run(self):
         """
@@ -68,9 +95,10 @@ class FundingMonitor:
 
             # Step 1: Fetch RSS feeds
             logger.info("Step 1: Fetching RSS feeds...")
-            articles = self.fetcher.fetch_all_feeds()
+            articles = self.fetcher.fetch_all_feeds(self.db.get_feed_states())
 
-            if not articles:
+            # Feeds answering 304 Not Modified legitimately return no articles
+            if not articles and not self.fetcher.not_modified:
                 logger.warning("No articles fetched from RSS feeds")
                 return False
 
@@ -82,6 +110,7 @@ class FundingMonitor:
 
             if not new_articles:
                 logger.info("No new articles to process")
+                self.db.update_feed_states(self.fetcher.feed_states)
                 # Still check for pending announcements from previous runs
                 pending_count = self._check_and_send_digest()
                 if pending_count == 0:
@@ -98,15 +127,22 @@ class FundingMonitor:
 
             # Step 4: Store results in database
             logger.info("Step 4: Storing results in database...")
-            self._store_results(new_articles, funding_announcements)
+            stored = self._store_results(new_articles, funding_announcements)
 
-            # Step 5: Generate and send email digest
-            logger.info("Step 5: Generating and sending email digest...")
-            email_sent = self._check_and_send_digest()
+            # Only once the articles are stored may their feeds answer 304
+            if stored:
+                self.db.update_feed_states(self.fetcher.feed_states)
 
-            # Step 6: Cleanup old entries
-            logger.info("Step 6: Cleaning up old database entries...")
-            self.db.cleanup_old_entries()
+            # Steps 5 and 6 overlap: cleanup only deletes long-processed
+            # articles, so it runs in the background while the digest is sent
+            logger.info("Step 5: Generating and sending email digest...")
+            logger.info("Step 6: Cleaning up old database entries (in the background)...")
+            cleanup = self.db.start_cleanup()
+            try:
+                email_sent = self._check_and_send_digest()
+            finally:
+                # Cleanup must finish before the database is closed
+                cleanup.join()
 
             # Print summary
             self._print_summary(len(articles), len(new_articles), len(funding_announcements), email_sent)
@@ -122,31 +158,54 @@ class FundingMonitor:
             return False
 
         finally:
-            # Close database connection
+            # Close database connection and the (reused) SMTP connection
             self.db.close()
+            self.email_sender.close()
 
-    def _filter_new_articles(self, articles: List[Dict]) -> List[Dict]:
+    def _filter_new_articles(self, articles: List[Article]) -> List[Article]:
         """
         Filter out articles that have already been processed.
 
+        An article is skipped if its URL is already stored, or if the same
+        text (see content_hash) is stored or appears earlier in this batch -
+        the same story syndicated under a different URL. Kept articles are
+        returned with content_hash set, so it is stored alongside them.
+
         Args:
             articles: List of all articles from RSS feeds
 
         Returns:
             List of new articles not in database
         """
-        new_articles = []
+        # Checked once: skips building per-article debug messages at INFO level
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # One bulk lookup instead of a query per article
+        processed_urls = self.db.get_processed_urls([article.url for article in articles])
 
+        candidates = []
         for article in articles:
-            url = article.get('url')
-            if not self.db.is_article_processed(url):
-                new_articles.append(article)
-            else:
+            url = article.url
+            if url not in processed_urls:
+                candidates.append((content_hash(article.title, article.description), article))
+            elif debug:
                 logger.debug(f"Skipping already processed article: {url}")
 
+        # Drop duplicates by content before the (expensive) funding detection
+        seen_hashes = self.db.get_known_content_hashes([h for h, _ in candidates])
+
+        new_articles = []
+        for h, article in candidates:
+            if h in seen_hashes:
+                if debug:
+                    logger.debug(f"Skipping duplicate article content: {article.url}")
+                continue
+            seen_hashes.add(h)
+            new_articles.append(article._replace(content_hash=h))
+
         return new_articles
 
-    def _detect_funding(self, articles: List[Dict]) -> List[Dict]:
+    def _detect_funding(self, articles: List[Article]) -> List[FundingAnnouncement]:
         """
         Run funding detection on all new articles.
 
@@ -154,60 +213,56 @@ class FundingMonitor:
             articles: List of new articles
 
         Returns:
-            List of funding announcement dictionaries
+            List of detected funding announcements
         """
-        funding_announcements = []
-
-        for article in articles:
-            result = self.detector.analyze_article(article)
-            if result:
-                funding_announcements.append(result)
-
-        return funding_announcements
+        return self.detector.analyze_articles(articles)
 
     def _store_results(
         self,
-        articles: List[Dict],
-        funding_announcements: List[Dict]
-    ):
+        articles: List[Article],
+        funding_announcements: List[FundingAnnouncement]
+    ) -> int:
         """
         Store articles and funding announcements in database.
 
         Args:
             articles: List of all new articles
             funding_announcements: List of detected funding announcements
+
+        Returns:
+            Number of articles stored (0 if the transaction failed)
         """
         # Create a lookup map for funding announcements by URL
-        funding_map = {fa['url']: fa for fa in funding_announcements}
+        funding_map = {fa.url: fa for fa in funding_announcements}
 
-        # Store each article
+        # Build rows for both tables, then store them in a single transaction
+        article_rows = []
+        announcement_rows = {}
         for article in articles:
-            url = article['url']
-            is_funding = url in funding_map
-
-            # Store article
-            article_id = self.db.store_article(
-                url=url,
-                title=article['title'],
-                source=article['source'],
-                published_date=article['published_date'],
-                is_funding_related=is_funding,
-                relevance_score=funding_map[url]['relevance_score'] if is_funding else 0
-            )
-
-            # If article has funding announcement, store it
-            if is_funding and article_id:
-                fa = funding_map[url]
-                self.db.store_funding_announcement(
-                    article_id=article_id,
-                    company_name=fa['company_name'],
-                    funding_stage=fa['funding_stage'],
-                    funding_amount=fa['funding_amount'],
-                    location=fa['location'],
-                    industry=fa['industry'],
-                    description=fa['description']
+            url = article.url
+            fa = funding_map.get(url)
+            article_rows.append((
+                url,
+                article.title,
+                article.source,
+                article.published_date,
+                int(fa is not None),
+                fa.relevance_score if fa else 0,
+                article.content_hash
+            ))
+            if fa is not None:
+                announcement_rows[url] = (
+                    fa.company_name,
+                    fa.funding_stage,
+                    fa.funding_amount,
+                    fa.location,
+                    fa.industry,
+                    fa.description
                 )
 
+        article_ids, _ = self.db.store_results_bulk(article_rows, announcement_rows)
+        return len(article_ids)
+
     def _check_and_send_digest(self) -> int:
         """
         Check for pending announcements and send digest if any exist.
@@ -277,6 +332,8 @@ class FundingMonitor:
 
 def main():
     """Main entry point for the script."""
+    _configure_logging()
+
     try:
         monitor = FundingMonitor()
         success = monitor.run()
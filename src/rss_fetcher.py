@@ -5,9 +5,13 @@ Handles network errors gracefully with retry logic.
 """
 
 import logging
-import time
-from typing import List, Dict, Optional
-from datetime import datetime
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, NamedTuple, Optional, Set, Tuple, Union
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 import feedparser
@@ -20,6 +24,28 @@ from src import config
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Used by _strip_html for every entry, so compiled once here
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Returned by fetch_feed when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+
+class Article(NamedTuple):
+    """
+    One feed entry as it moves through the pipeline.
+
+    A NamedTuple rather than a dict: a fraction of the memory per article,
+    and fields are read by attribute (article.url) in the hot loops.
+    """
+    title: str
+    url: str
+    description: str
+    published_date: str  # ISO format
+    source: str          # RSS feed source name
+    content_hash: Optional[int] = None  # Set by FundingMonitor._filter_new_articles
+
 
 class RSSFetcher:
     """
@@ -38,7 +64,23 @@ class RSSFetcher:
 
     def __init__(self):
         """Initialize RSS fetcher with retry logic."""
-        self.session = self._create_session()
+        # One session per worker thread (requests.Session isn't thread-safe)
+        self._local = threading.local()
+
+        # Conditional GET state (see fetch_all_feeds):
+        # validators sent with requests, validators received in this run,
+        # and sources that answered 304 Not Modified
+        self._known_states: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self.feed_states: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self.not_modified: Set[str] = set()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._create_session()
+        return session
 
     def _create_session(self) -> requests.Session:
         """
@@ -71,28 +113,56 @@ class RSSFetcher:
 
         return session
 
-    def fetch_feed(self, url: str, source_name: str) -> Optional[str]:
+    def fetch_feed(self, url: str, source_name: str) -> Optional[bytes]:
         """
         Fetch RSS feed XML from a URL.
 
+        The raw body is returned undecoded: feedparser works on bytes and
+        reads the charset from the XML declaration itself, so decoding to
+        str here (with requests' guessed encoding) would only add a copy.
+
+        If validators from a previous fetch are known, they are sent as
+        If-None-Match / If-Modified-Since; an unchanged feed then costs a
+        bodiless 304 instead of the full document and a parse.
+
         Args:
             url: RSS feed URL
             source_name: Name of the source (for logging)
 
         Returns:
-            RSS feed XML content as string, or None if failed
+            RSS feed XML content as bytes, NOT_MODIFIED if the feed hasn't
+            changed since the last fetch, or None if failed
         """
         try:
             logger.info(f"Fetching RSS feed: {source_name} ({url})")
 
+            headers = {}
+            etag, last_modified = self._known_states.get(url, (None, None))
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
             response = self.session.get(
                 url,
+                headers=headers,
                 timeout=config.REQUEST_TIMEOUT
             )
+
+            if response.status_code == 304:
+                logger.info(f"{source_name} not modified since last fetch")
+                return NOT_MODIFIED
+
             response.raise_for_status()  # Raise exception for bad status codes
 
+            # Remember validators for the next run (saved by the caller)
+            self.feed_states[url] = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+
             logger.info(f"Successfully fetched {source_name}")
-            return response.text
+            return response.content
 
         except requests.exceptions.Timeout:
             logger.error(f"Timeout fetching {source_name}: {url}")
@@ -110,16 +180,16 @@ class RSSFetcher:
             logger.error(f"Unexpected error fetching {source_name}: {e}")
             return None
 
-    def parse_feed(self, xml_content: str, source_name: str) -> List[Dict]:
+    def parse_feed(self, xml_content: Union[bytes, str], source_name: str) -> List[Article]:
         """
         Parse RSS feed XML into structured article data.
 
         Args:
-            xml_content: RSS feed XML string
+            xml_content: RSS feed XML (bytes from fetch_feed, or a string)
             source_name: Name of the source (for logging)
 
         Returns:
-            List of article dictionaries with title, link, description, published_date
+            List of Article tuples (title, url, description, published_date, source)
         """
         if not xml_content:
             return []
@@ -149,7 +219,7 @@ class RSSFetcher:
             logger.error(f"Error parsing RSS feed for {source_name}: {e}")
             return []
 
-    def _extract_article_data(self, entry, source_name: str) -> Optional[Dict]:
+    def _extract_article_data(self, entry, source_name: str) -> Optional[Article]:
         """
         Extract article data from a single RSS entry.
 
@@ -158,28 +228,30 @@ class RSSFetcher:
             source_name: Name of the source
 
         Returns:
-            Dictionary with article data, or None if required fields missing
+            Article, or None if required fields missing
         """
+        # Entries are dicts: get() avoids the exception hasattr() raises
+        # internally for every missing field
+        title = entry.get('title')
+        link = entry.get('link')
+
         # Required fields: title and link
-        if not hasattr(entry, 'title') or not hasattr(entry, 'link'):
+        if not title or not link:
             logger.debug(f"Skipping entry without title or link from {source_name}")
             return None
 
         # Extract title (required)
-        title = entry.title.strip()
+        title = title.strip()
 
-        # Extract link (required)
-        link = entry.link.strip()
+        # Extract link (required), normalized so tracking variants dedupe
+        link = self._normalize_url(link.strip())
 
         # Extract description (optional, may be summary or content)
-        description = ""
-        if hasattr(entry, 'description'):
-            description = entry.description
-        elif hasattr(entry, 'summary'):
-            description = entry.summary
-        elif hasattr(entry, 'content'):
+        description = entry.get('description') or entry.get('summary')
+        if not description:
             # Some feeds use 'content' instead
-            description = entry.content[0].value if entry.content else ""
+            content = entry.get('content')
+            description = content[0].get('value', '') if content else ""
 
         # Remove HTML tags from description (simple approach)
         description = self._strip_html(description)
@@ -187,20 +259,51 @@ class RSSFetcher:
         # Extract published date
         published_date = self._extract_date(entry)
 
-        return {
-            'title': title,
-            'url': link,
-            'description': description,
-            'published_date': published_date,
-            'source': source_name
-        }
+        return Article(
+            title=title,
+            url=link,
+            description=description,
+            published_date=published_date,
+            source=source_name
+        )
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """
+        Strip tracking parameters (utm_*) and the fragment from a URL.
+
+        Feeds often link the same article with different campaign tags,
+        which would otherwise be stored as separate articles.
+
+        Args:
+            url: Article URL from the feed
+
+        Returns:
+            URL without utm_* query parameters or #fragment
+        """
+        # Fast path: most links carry neither
+        if '#' not in url and 'utm_' not in url:
+            return url
+
+        parts = urlsplit(url)
+        query = parts.query
+        if 'utm_' in query:
+            query = urlencode([
+                (key, value)
+                for key, value in parse_qsl(query, keep_blank_values=True)
+                if not key.startswith('utm_')
+            ])
+
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
 
     def _extract_date(self, entry) -> str:
         """
         Extract and normalize publication date from RSS entry.
 
         RSS feeds use various date formats (RFC 822, ISO 8601, etc.)
-        We use dateutil.parser to handle all formats automatically.
+        feedparser already decodes the common ones into UTC struct_time
+        fields (published_parsed, ...), so those are used directly; only
+        dates it couldn't decode fall back to dateutil.parser.
 
         Args:
             entry: feedparser entry object
@@ -208,12 +311,21 @@ class RSSFetcher:
         Returns:
             ISO format datetime string, or current time if parsing fails
         """
-        # Try different date fields
+        # Dates feedparser has already parsed (normalized to UTC)
+        for field in ('published_parsed', 'updated_parsed', 'created_parsed'):
+            parsed = entry.get(field)
+            if parsed:
+                try:
+                    return datetime(*parsed[:6], tzinfo=timezone.utc).isoformat()
+                except (ValueError, TypeError) as e:
+                    logger.debug(f"Invalid {field} {parsed}: {e}")
+
+        # Fall back to parsing the raw date strings
         date_fields = ['published', 'updated', 'created']
 
         for field in date_fields:
-            if hasattr(entry, field):
-                date_str = getattr(entry, field)
+            date_str = entry.get(field)
+            if date_str:
                 try:
                     # Parse date string (handles multiple formats)
                     dt = date_parser.parse(date_str)
@@ -241,39 +353,90 @@ class RSSFetcher:
         Returns:
             Text without HTML tags
         """
-        import re
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
-
-    def fetch_all_feeds(self) -> List[Dict]:
+        # Remove HTML tags, then collapse extra whitespace
+        return _WS_RE.sub(' ', _TAG_RE.sub('', text)).strip()
+
+    def fetch_all_feeds(
+        self,
+        feed_states: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None
+    ) -> List[Article]:
         """
         Fetch and parse all configured RSS feeds.
 
+        Feeds are fetched concurrently, one worker per feed, so wall time is
+        roughly the slowest feed rather than the sum of all feeds. To stay
+        polite, at most REQUEST_MAX_PER_HOST requests run against any one
+        host at a time. Each worker parses its feed as soon as it arrives,
+        so parsing overlaps with the other downloads.
+
+        After the call, self.feed_states holds the validators received from
+        feeds that returned content (persist them once their articles are
+        stored) and self.not_modified the sources that answered 304.
+
+        Args:
+            feed_states: Validators from earlier runs, feed URL -> (etag,
+                last_modified); feeds without an entry are fetched in full
+
         Returns:
             List of all articles from all feeds
         """
+        self._known_states = feed_states or {}
+        self.feed_states = {}
+        self.not_modified = set()
+
+        # One semaphore per host caps concurrent requests to that host
+        host_limits = defaultdict(lambda: threading.Semaphore(config.REQUEST_MAX_PER_HOST))
+        sources = list(config.RSS_FEEDS)
+        feed_urls = list(config.RSS_FEEDS.values())
+        limits = [host_limits[urlsplit(feed_url).netloc] for feed_url in feed_urls]
+
+        # Fetch and parse all feeds in parallel (network wait overlaps)
+        with ThreadPoolExecutor(max_workers=max(len(sources), 1)) as executor:
+            parsed = dict(zip(sources, executor.map(self._fetch_and_parse, sources, feed_urls, limits)))
+
+        # Combine in configured feed order so output is deterministic
         all_articles = []
 
-        for source_name, feed_url in config.RSS_FEEDS.items():
-            # Fetch feed
-            xml_content = self.fetch_feed(feed_url, source_name)
+        for source_name in config.RSS_FEEDS:
+            articles = parsed.get(source_name)
 
-            if xml_content:
-                # Parse feed
-                articles = self.parse_feed(xml_content, source_name)
+            if articles is not None:
                 all_articles.extend(articles)
-
-                # Be polite: wait between requests
-                time.sleep(config.REQUEST_DELAY)
             else:
                 logger.warning(f"Skipping {source_name} due to fetch error")
 
         logger.info(f"Total articles fetched: {len(all_articles)}")
         return all_articles
 
+    def _fetch_and_parse(
+        self,
+        source_name: str,
+        feed_url: str,
+        host_limit: threading.Semaphore
+    ) -> Optional[List[Article]]:
+        """
+        Fetch one feed (holding its host's slot) and parse it.
+
+        Args:
+            source_name: Name of the source
+            feed_url: RSS feed URL
+            host_limit: Semaphore shared by all feeds on the same host
+
+        Returns:
+            Parsed articles ([] if not modified), or None if the fetch failed
+        """
+        # Only the request holds the host slot; parsing doesn't touch the host
+        with host_limit:
+            xml_content = self.fetch_feed(feed_url, source_name)
+
+        # Unchanged since the last run: nothing new to parse
+        if xml_content is NOT_MODIFIED:
+            self.not_modified.add(source_name)
+            return []
+
+        # Parse right away, while other workers are still downloading
+        return self.parse_feed(xml_content, source_name) if xml_content else None
+
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -294,8 +457,8 @@ if __name__ == "__main__":
     # Display first few articles
     print("\nSample articles:")
     for i, article in enumerate(articles[:5], 1):
-        print(f"\n{i}. {article['title']}")
-        print(f"   Source: {article['source']}")
-        print(f"   URL: {article['url'][:60]}...")
-        print(f"   Published: {article['published_date']}")
-        print(f"   Description: {article['description'][:100]}...")
+        print(f"\n{i}. {article.title}")
+        print(f"   Source: {article.source}")
+        print(f"   URL: {article.url[:60]}...")
+        print(f"   Published: {article.published_date}")
+        print(f"   Description: {article.description[:100]}...")